@@ -0,0 +1,30 @@
+import io
+import sys
+
+import pytest
+
+
+class _Cap:
+    """Minimal stdout replacement that records text writes, with a binary buffer like a real console."""
+    def __init__(self):
+        self.parts = []
+        self.buffer = io.BytesIO()
+
+    def write(self, s):
+        self.parts.append(s)
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture
+def capture_stdout(monkeypatch):
+    """
+    Return a function that replaces sys.stdout with a fresh _Cap and returns it.
+    Call it in the test body: pytest reinstalls its own capture between setup and call.
+    """
+    def install():
+        cap = _Cap()
+        monkeypatch.setattr(sys, 'stdout', cap)
+        return cap
+    return install
@@ -1,8 +1,7 @@
-import subprocess
 import sys
-import re
 
-def test_cli_scan(monkeypatch):
+
+def test_cli_scan(monkeypatch, capture_stdout):
     # Patch subprocess.run to return a fake system_profiler output
     class FakeCompletedProcess:
         def __init__(self, stdout):
@@ -24,22 +23,34 @@ def test_cli_scan(monkeypatch):
                 Signal / Noise: -60 dBm / -92 dBm
     '''
     def fake_run(*args, **kwargs):
-        return FakeCompletedProcess(sample_output)
+        # system_profiler is run without text=True, so stdout is bytes
+        return FakeCompletedProcess(sample_output.encode())
     monkeypatch.setattr('subprocess.run', fake_run)
+    # Sample output is system_profiler format, so take the macOS path on any host
+    monkeypatch.setattr('tinywifi.scan._OS_ARG', 'macos')
 
     # Run the CLI as a module
     from tinywifi.cli import main
-    import io
-    from contextlib import redirect_stdout
 
-    f = io.StringIO()
-    sys.argv = ['tinywifi', 'scan']
-    with redirect_stdout(f):
-        main()
-    output = f.getvalue()
+    cap = capture_stdout()
+    monkeypatch.setattr(sys, 'argv', ['tinywifi', 'scan'])
+    main()
+    output = ''.join(cap.parts)
     # Check for expected SSIDs and colored output
     assert 'MyHomeWiFi' in output
     assert 'Office5G' in output
-    assert re.search(r'2\.4GHz', output)
-    assert re.search(r'5GHz', output)
+    assert '2.4GHz' in output
+    assert '5GHz' in output
     assert 'Scanning for WiFi networks' in output
+
+
+def test_fast_parse():
+    from tinywifi.cli import _fast_parse
+    assert _fast_parse(['scan']) == ('scan', None, 5)
+    assert _fast_parse(['scan', '--timeout', '3']) == ('scan', None, 3)
+    assert _fast_parse(['monitor', 'MyWiFi', '--timeout', '2']) == ('monitor', 'MyWiFi', 2)
+    # Help, missing SSID and unknown flags fall back to argparse
+    assert _fast_parse([]) is None
+    assert _fast_parse(['scan', '--help']) is None
+    assert _fast_parse(['monitor']) is None
+    assert _fast_parse(['scan', '--timeout', 'abc']) is None
@@ -0,0 +1,48 @@
+import threading
+
+
+def test_monitor_ssid_stale_rows_keep_cadence(monkeypatch, capture_stdout):
+    net = {'ssid': 'MyHomeWiFi', 'rssi': -48, 'freq': 2437, 'channel': '6', 'band': '2.4GHz'}
+    release = threading.Event()
+    calls = []
+
+    def fake_get_wifi_networks(timeout=5, target_os="macos", raw=False, cache_ttl=0):
+        calls.append(timeout)
+        if len(calls) == 2:
+            release.wait(5)  # the first background rescan blocks until the test ends
+        return {'MyHomeWiFi_2437': dict(net)}, 'MyHomeWiFi_2437', None
+    monkeypatch.setattr('tinywifi.scan.get_wifi_networks', fake_get_wifi_networks)
+
+    from tinywifi.monitor import monitor_ssid
+
+    cap = capture_stdout()
+    try:
+        monitor_ssid('MyHomeWiFi', timeout=2, count=4, delay=0)
+    finally:
+        release.set()
+
+    rows = cap.buffer.getvalue().decode().splitlines()[1:]
+    # Every sample is printed on cadence without waiting for the blocked rescan:
+    # the initial scan is shown fresh, the rows after it reuse it and are marked stale
+    assert [row.split()[0] for row in rows] == ['1', '2*', '3*', '4*']
+
+
+def test_monitor_ssid_scans_host_os(monkeypatch, capture_stdout):
+    net = {'ssid': 'HomeNet', 'rssi': -40, 'freq': '2437', 'channel': '6', 'band': '2.4GHz'}
+    target_oses = []
+
+    def fake_get_wifi_networks(timeout=5, target_os="macos", raw=False, cache_ttl=0):
+        target_oses.append(target_os)
+        return {'HomeNet_2437': dict(net)}, 'HomeNet_2437', None
+    monkeypatch.setattr('tinywifi.scan.get_wifi_networks', fake_get_wifi_networks)
+    monkeypatch.setattr('tinywifi.scan._OS_ARG', 'linux')
+
+    from tinywifi.monitor import monitor_ssid
+
+    cap = capture_stdout()
+    monitor_ssid('HomeNet', timeout=2, count=2, delay=0)
+
+    rows = cap.buffer.getvalue().decode().splitlines()[1:]
+    assert len(rows) == 2
+    # Every scan, including the background rescans, targets the host OS
+    assert target_oses and set(target_oses) == {'linux'}
@@ -0,0 +1,313 @@
+import subprocess
+
+from tinywifi.scan import (
+    parse_system_profiler_output, _parse_macos_profiler, _parse_nmcli_lines,
+    _scan_macos, _get_macos_corewlan_networks, _get_linux_iwlist_networks, _get_linux_iw_scan,
+    _parse_iw_lines, channel_to_freq, freq_to_channel
+)
+
+SAMPLE_OUTPUT = '''
+          Current Network Information:
+            MyHomeWiFi:
+              PHY Mode: 802.11ax
+              Channel: 6 (2GHz, 20MHz)
+              Signal / Noise: -47 dBm / -94 dBm
+              Transmit Rate: 144
+          Other Local Wi-Fi Networks:
+            MyHomeWiFi:
+              PHY Mode: 802.11ax
+              Channel: 6 (2GHz, 20MHz)
+              Network Type: Infrastructure
+              Security: WPA2 Personal
+              Signal / Noise: -48 dBm / -94 dBm
+            Office5G:
+              PHY Mode: 802.11ac
+              Channel: 149 (5GHz, 80MHz)
+              Network Type: Infrastructure
+              Security: WPA2 Personal
+              Signal / Noise: -60 dBm / -92 dBm
+'''
+
+
+def test_parse_system_profiler_output():
+    networks = parse_system_profiler_output(SAMPLE_OUTPUT)
+    assert networks == [
+        {'ssid': 'MyHomeWiFi', 'rssi': -48, 'channel': '6', 'freq': 2437, 'band': '2.4GHz'},
+        {'ssid': 'Office5G', 'rssi': -60, 'channel': '149', 'freq': 5745, 'band': '5GHz'},
+    ]
+
+
+def test_parse_macos_profiler():
+    networks, connected_id, rate = _parse_macos_profiler(SAMPLE_OUTPUT.encode())
+    assert [(n['ssid'], n['rssi'], n['noise'], n['channel'], n['band']) for n in networks] == [
+        ('MyHomeWiFi', -48, -94, '6', '2.4GHz'),
+        ('Office5G', -60, -92, '149', '5GHz'),
+    ]
+    assert connected_id == 'MyHomeWiFi_2437'
+    assert rate == '144'
+    # Rescans skip the connected-network section
+    assert _parse_macos_profiler(SAMPLE_OUTPUT.encode(), connected=False)[1:] == (None, None)
+
+
+def test_channel_freq_round_trip():
+    for channel in ('1', '6', '13', '14', '36', '100', '149', '165'):
+        assert freq_to_channel(channel_to_freq(channel)) == channel
+    assert channel_to_freq('14') == 2484
+    assert freq_to_channel('5745') == '149'
+    assert freq_to_channel(2475) == 'Unknown'
+    assert channel_to_freq('--') == 'Unknown'
+
+
+def test_parse_nmcli_lines():
+    lines = [
+        'yes:My\\:Net:AA\\:BB\\:CC\\:DD\\:EE\\:FF:70:6:2437 MHz:Infra:130 Mbit/s:WPA2\n',
+        'no:"Cafe" 5G:11\\:22\\:33\\:44\\:55\\:66:40:149:5745 MHz:Infra:54 Mbit/s:\n',
+        'no:Lab6E:11\\:22\\:33\\:44\\:55\\:77:55:5:5975 MHz:Infra:540 Mbit/s:WPA3\n',
+        # Escaped backslash does not escape the following separator
+        'no:Back\\\\:11\\:22\\:33\\:44\\:55\\:88:30:11:2462 MHz:Infra:54 Mbit/s:WPA2\n',
+        '\n',
+    ]
+    networks = _parse_nmcli_lines(lines)
+    assert [(n['ssid'], n['bssid'], n['signal'], n['band'], n['active']) for n in networks] == [
+        ('My:Net', 'AA:BB:CC:DD:EE:FF', 70, '2.4GHz', True),
+        ('"Cafe" 5G', '11:22:33:44:55:66', 40, '5GHz', False),
+        ('Lab6E', '11:22:33:44:55:77', 55, '6GHz', False),
+        ('Back\\', '11:22:33:44:55:88', 30, '2.4GHz', False),
+    ]
+
+
+def _profiler_output(*networks):
+    """Build system_profiler output listing (ssid, channel, rssi) networks."""
+    lines = ['          Other Local Wi-Fi Networks:']
+    for ssid, channel, rssi in networks:
+        lines += [
+            f'            {ssid}:',
+            f'              Channel: {channel} (2GHz, 20MHz)',
+            f'              Signal / Noise: {rssi} dBm / -94 dBm',
+        ]
+    return '\n'.join(lines).encode()
+
+
+def test_scan_macos_merges_and_stops_early(monkeypatch):
+    outputs = [
+        _profiler_output(('Home', 6, -60)),
+        _profiler_output(('Home', 6, -50), ('Cafe', 1, -70)),
+        _profiler_output(('Home', 6, -55), ('Cafe', 1, -65)),  # nothing new
+        _profiler_output(('Home', 6, -45)),  # nothing new again: stop
+        _profiler_output(('Late', 11, -40)),
+        _profiler_output(('Late', 11, -40)),
+    ]
+    calls = []
+
+    def fake_run_system_profiler(cache_ttl=0):
+        calls.append(cache_ttl)
+        return subprocess.CompletedProcess([], 0, stdout=outputs[len(calls) - 1])
+    monkeypatch.setattr('tinywifi.scan._run_system_profiler', fake_run_system_profiler)
+    monkeypatch.setattr('tinywifi.scan._get_macos_corewlan_networks', lambda: None)
+
+    networks, connected_id, raw_output = _scan_macos(len(outputs))
+    # The strongest reading of each network is kept across scans
+    assert {uid: net['rssi'] for uid, net in networks.items()} == {'Home_2437': -45, 'Cafe_2412': -65}
+    # One unchanged rescan does not stop the loop (the -45 reading comes from the
+    # scan after it); the second does, and no scan is queued after it
+    assert len(calls) == 4
+    assert connected_id is None
+    assert raw_output is None
+
+    # A new network after one unchanged rescan resets the count, and the scan
+    # held back meanwhile is still run
+    outputs[:] = [
+        _profiler_output(('Home', 6, -60)),
+        _profiler_output(('Home', 6, -60)),  # nothing new
+        _profiler_output(('Home', 6, -60), ('Cafe', 1, -70)),
+        _profiler_output(('Home', 6, -60), ('Cafe', 1, -70)),  # nothing new
+        _profiler_output(('Home', 6, -60), ('Cafe', 1, -70)),  # nothing new again: stop
+        _profiler_output(('Late', 11, -40)),
+    ]
+    calls.clear()
+    networks = _scan_macos(len(outputs))[0]
+    assert sorted(networks) == ['Cafe_2412', 'Home_2437']
+    assert len(calls) == 5
+
+
+IWLIST_OUTPUT = """wlan0     Scan completed :
+          Cell 01 - Address: AA:BB:CC:DD:EE:01
+                    Channel:6
+                    Frequency:2.437 GHz (Channel 6)
+                    Quality=70/70  Signal level=-40 dBm  Noise level=-90 dBm
+                    Encryption key:on
+                    ESSID:"Home"
+                    Mode:Master
+          Cell 02 - Address: AA:BB:CC:DD:EE:02
+                    Channel:1
+                    Frequency:2.412 GHz (Channel 1)
+                    Quality=40/70
+                    Encryption key:off
+                    ESSID:"Cafe"
+          Cell 03 - Address: AA:BB:CC:DD:EE:03
+                    Frequency:5.745 GHz
+                    Quality=30/70  Signal level=-75 dBm
+                    ESSID:""
+"""
+
+
+def test_get_linux_iwlist_networks(monkeypatch):
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, 0, stdout=IWLIST_OUTPUT)
+    monkeypatch.setattr('subprocess.run', fake_run)
+    monkeypatch.setattr('tinywifi.scan._detect_linux_interface', lambda: 'wlan0')
+    monkeypatch.setattr('tinywifi.scan._have_tool', lambda name: True)
+
+    networks = _get_linux_iwlist_networks()
+    # Cell 03 has no ESSID and is dropped
+    assert networks == [
+        {'bssid': 'AA:BB:CC:DD:EE:01', 'channel': '6', 'freq': '2437', 'rssi': -40,
+         'noise': -90, 'snr': 50, 'security': 'WPA/WPA2', 'ssid': 'Home', 'mode': 'Infra'},
+        # Quality= without a Signal level leaves rssi unset
+        {'bssid': 'AA:BB:CC:DD:EE:02', 'channel': '1', 'freq': '2412',
+         'security': 'None', 'ssid': 'Cafe'},
+    ]
+
+
+IW_OUTPUT = (
+    "BSS aa:bb:cc:dd:ee:01(on wlan0) -- associated\n"
+    "\tTSF: 123456789 usec (0d, 00:02:03)\n"
+    "\tfreq: 2437\n"
+    "\tbeacon interval: 100 TUs\n"
+    "\tcapability: ESS Privacy ShortSlotTime (0x0411)\n"
+    "\tsignal: -42.00 dBm\n"
+    "\tHT operation:\n"
+    "\t\t * primary channel: 6\n"
+    "\t\tsignal: -10.00 dBm\n"  # nested, not the BSS signal
+    "\tSSID: Home\n"
+    "\tsignal: -20.00 dBm\n"  # after every field was read: block skipped
+    "BSS aa:bb:cc:dd:ee:02(on wlan0)\n"
+    "\tfreq: 5180\n"
+    "\tcapability: ESS Privacy (0x0011)\n"
+    "\tsignal: -70.00 dBm\n"
+    "\tSSID: \n"  # hidden network
+    "BSS aa:bb:cc:dd:ee:03(on wlan0)\n"
+    "\tfreq: 5975.0\n"
+    "\tcapability: ESS (0x0001)\n"
+    "\tsignal: -60.00 dBm\n"
+    "\tSSID: Lab6E\n"
+    "BSS aa:bb:cc:dd:ee:01(on wlan0)\n"  # the same BSS reported again
+    "\tfreq: 2437\n"
+    "\tcapability: ESS Privacy ShortSlotTime (0x0411)\n"
+    "\tsignal: -50.00 dBm\n"
+    "\tSSID: Home\n"
+)
+
+
+def test_parse_iw_lines():
+    networks = _parse_iw_lines(IW_OUTPUT.splitlines(True))
+    # The hidden network is dropped; the duplicate BSS block is kept as parsed
+    assert networks == [
+        {'bssid': 'aa:bb:cc:dd:ee:01', 'active': True, 'freq': '2437',
+         'security': 'WPA/WPA2', 'rssi': -42, 'ssid': 'Home'},
+        {'bssid': 'aa:bb:cc:dd:ee:03', 'freq': '5975', 'security': 'None',
+         'rssi': -60, 'ssid': 'Lab6E'},
+        {'bssid': 'aa:bb:cc:dd:ee:01', 'freq': '2437', 'security': 'WPA/WPA2',
+         'rssi': -50, 'ssid': 'Home'},
+    ]
+
+
+def test_get_linux_iw_scan(monkeypatch):
+    monkeypatch.setattr('tinywifi.scan._detect_linux_interface', lambda: 'wlan0')
+    monkeypatch.setattr(
+        'tinywifi.scan._get_linux_iw_networks', lambda interface: _parse_iw_lines(IW_OUTPUT.splitlines(True))
+    )
+    networks, connected_id = _get_linux_iw_scan()
+    # The duplicate BSS block collapses onto the same unique_id
+    assert sorted(networks) == ['Home_2437', 'Lab6E_5975']
+    assert connected_id == 'Home_2437'
+    lab = networks['Lab6E_5975']
+    assert (lab['channel'], lab['band'], lab['mode']) == ('5', '6GHz', 'Infra')
+
+
+class _CWChannel:
+    def __init__(self, number, band):
+        self.number, self.band = number, band
+
+    def channelNumber(self):
+        return self.number
+
+    def channelBand(self):
+        return self.band
+
+
+class _CWNetwork:
+    def __init__(self, ssid, channel, rssi, security=()):
+        self._ssid, self._channel, self._rssi, self._security = ssid, channel, rssi, security
+
+    def ssid(self):
+        return self._ssid
+
+    def bssid(self):
+        return None
+
+    def wlanChannel(self):
+        return self._channel
+
+    def rssiValue(self):
+        return self._rssi
+
+    def noiseMeasurement(self):
+        return -95
+
+    def ibss(self):
+        return False
+
+    def supportsSecurity_(self, mode):
+        return mode in self._security
+
+
+class _CWInterface:
+    def __init__(self, networks, ssid, channel, rate):
+        self._networks, self._ssid, self._channel, self._rate = networks, ssid, channel, rate
+
+    def scanForNetworksWithName_error_(self, name, error):
+        return self._networks, None
+
+    def ssid(self):
+        return self._ssid
+
+    def wlanChannel(self):
+        return self._channel
+
+    def transmitRate(self):
+        return self._rate
+
+
+class _CWClient:
+    def __init__(self, iface):
+        self.iface = iface
+
+    def interface(self):
+        return self.iface
+
+
+def test_get_macos_corewlan_networks(monkeypatch):
+    lab_channel = _CWChannel(5, 3)  # 6GHz channel 5
+    networks = [
+        _CWNetwork('Home', _CWChannel(6, 1), -45, security=(4,)),
+        _CWNetwork('Lab6E', lab_channel, -60, security=(11, 4)),
+        _CWNetwork('Office5G', _CWChannel(149, 2), -70),
+        _CWNetwork(None, _CWChannel(1, 1), -80),  # hidden
+    ]
+    iface = _CWInterface(networks, 'Lab6E', lab_channel, 1200.0)
+    monkeypatch.setattr('tinywifi.scan._CW_CLIENT', _CWClient(iface))
+
+    networks, connected_id, rate = _get_macos_corewlan_networks()
+    assert [(n['ssid'], n['channel'], n['freq'], n['band'], n['security']) for n in networks] == [
+        ('Home', '6', 2437, '2.4GHz', 'WPA2 Personal'),
+        # 6GHz channel 5 is 5975 MHz, not 2.4GHz channel 5 (2432 MHz)
+        ('Lab6E', '5', 5975, '6GHz', 'WPA3 Personal'),
+        ('Office5G', '149', 5745, '5GHz', '--'),
+    ]
+    assert networks[0]['noise'] == -95
+    assert connected_id == 'Lab6E_5975'
+    assert rate == '1200'
+    # No CoreWLAN interface: callers fall back to system_profiler
+    monkeypatch.setattr('tinywifi.scan._CW_CLIENT', _CWClient(None))
+    assert _get_macos_corewlan_networks() is None
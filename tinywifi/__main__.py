@@ -7,11 +7,13 @@
 # 17 July 2025
 # github.com/jasonacox/tinywifi
 from tinywifi import __version__, __author__
-from .cli import main
-
-print(f"TinyWiFi {__version__}")
-print()
 
 
 if __name__ == "__main__":
+    print(f"TinyWiFi {__version__}")
+    print()
+
+    # Imported here so 'import tinywifi.__main__' stays side-effect free.
+    # colorama (autoreset) is initialized by scan.py when a command first needs it.
+    from .cli import main
     main()
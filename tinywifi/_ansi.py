@@ -0,0 +1,39 @@
+"""
+_ansi.py
+--------
+Precomputed ANSI color escape constants for TinyWiFi hot print paths.
+
+Colors are selected once at import: real escape sequences when stdout is a
+terminal, empty strings otherwise (pipes, files, captured output). On Windows
+the console is switched into VT mode once via colorama so the same sequences
+work there too.
+
+Author: Jason A. Cox
+github.com/jasonacox/tinywifi
+"""
+import os
+import sys
+
+_ENABLED = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+
+if _ENABLED and os.name == "nt":
+    try:
+        from colorama import just_fix_windows_console
+        just_fix_windows_console()
+    except ImportError:
+        # Older colorama without just_fix_windows_console()
+        from colorama import init
+        init()
+
+if _ENABLED:
+    RED = "\x1b[31m"
+    GREEN = "\x1b[32m"
+    YELLOW = "\x1b[33m"
+    CYAN = "\x1b[36m"
+    WHITE = "\x1b[37m"
+    LGREEN = "\x1b[92m"
+    LMAGENTA = "\x1b[95m"
+    LRED = "\x1b[91m"
+    RESET = "\x1b[0m"
+else:
+    RED = GREEN = YELLOW = CYAN = WHITE = LGREEN = LMAGENTA = LRED = RESET = ""
@@ -6,20 +6,60 @@ Command-line interface for TinyWiFi.
 Features:
 - scan: Scan for WiFi networks and display results in a colorized table.
 - monitor: (mocked) Monitor a specific SSID for a given timeout.
-- Uses argparse for flexible command parsing and help output.
+- Fast hand-parsed dispatch for common invocations; argparse for help and everything else.
 
 Author: Jason A. Cox
 17 July 2025
 github.com/jasonacox/tinywifi
 """
-import argparse
 import platform
 import sys
-from .scan import scan, print_table
-from .monitor import monitor_ssid
 
+_COMMANDS = ("scan", "monitor")
+
+
+def _fast_parse(argv):
+    """
+    Hand-parse the common 'scan [--timeout N]' and 'monitor SSID [--timeout N]'
+    invocations so the happy path skips building the argparse parser.
+    Args:
+        argv (list): Command line arguments (without the program name).
+    Returns:
+        tuple or None: (command, ssid, timeout), or None to fall back to argparse.
+    """
+    if not argv or argv[0] not in _COMMANDS:
+        return None
+    command = argv[0]
+    ssid = None
+    timeout = 5
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--timeout" and i + 1 < len(argv):
+            try:
+                timeout = int(argv[i + 1])
+            except ValueError:
+                return None
+            i += 2
+        elif command == "monitor" and ssid is None and not arg.startswith("-"):
+            ssid = arg
+            i += 1
+        else:
+            # --help, unknown flags, extra positionals: let argparse handle them
+            return None
+    if command == "monitor" and ssid is None:
+        return None
+    return command, ssid, timeout
+
+
+def _parse_args():
+    """
+    Full argparse-based parsing; used for help, errors, and uncommon forms.
+    Returns:
+        tuple: (command, ssid, timeout)
+    """
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(
         description="TinyWiFi: WiFi signal analysis tool (cross-platform)",
         usage="python -m tinywifi {scan,monitor} [options]",
@@ -43,12 +83,24 @@ def main():
         parser.print_help()
         sys.exit(0)
 
+    return args.command, getattr(args, "ssid", None), args.timeout
+
+
+def main():
+    parsed = _fast_parse(sys.argv[1:])
+    if parsed is None:
+        parsed = _parse_args()
+    command, ssid, timeout = parsed
+
     # Platform check removed; scan() auto-detects OS
 
-    if args.command == "scan":
-        scan(timeout=args.timeout)
-    elif args.command == "monitor":
-        monitor_ssid(args.ssid, timeout=args.timeout)
+    # Command modules (and colorama/subprocess with them) load only when needed
+    if command == "scan":
+        from .scan import scan
+        scan(timeout=timeout, as_list=False)  # the table is the output; skip the list copy
+    elif command == "monitor":
+        from .monitor import monitor_ssid
+        monitor_ssid(ssid, timeout=timeout)
 
 
 if __name__ == "__main__":
@@ -12,10 +12,38 @@ Author: Jason A. Cox
 18 July 2025
 github.com/jasonacox/tinywifi
 """
+import io
+import re
+import sys
 import time
-import subprocess
-from colorama import Fore, Style
-from .scan import parse_system_profiler_output, channel_to_freq, get_wifi_networks
+from ._ansi import RED, GREEN, YELLOW, CYAN, WHITE, LGREEN, LMAGENTA, LRED, RESET
+
+# Monitor table header, colored and encoded once at import
+_MONITOR_HEADER = (
+    CYAN
+    + f"{'Sample':<8} {'Signal':<8} {'Freq':<8} {'Channel':<8} {'Band':<7} {'Conn':<6} {'Retries':<8} {'InvBeacon':<10} {'InvCrypt':<9} {'InvFrag':<8}"
+    + RESET
+    + "\n"
+).encode()
+
+# Selection menu markers for the connected network
+_STAR_ON = f"{YELLOW}*{RESET}"
+_STAR_OFF = " "
+
+# Pre-encoded colors for the monitor row byte path
+_FG_WHITE = WHITE.encode()
+_FG_YELLOW = YELLOW.encode()
+_FG_LGREEN = LGREEN.encode()
+_FG_LMAGENTA = LMAGENTA.encode()
+_RESET_NL = (RESET + "\n").encode()
+
+# Pre-colored, pre-padded Conn column cells (width 6 plus separator)
+_CONN = {True: (GREEN + "True   ").encode(), False: (RED + "False  ").encode()}
+
+# Section header and precompiled matchers for get_current_network_info()
+_CUR_HEADER = "Current Network Information:"
+_SIG_RE = re.compile(r'\s*Signal / Noise:\s*(-?\d+)')
+_CHAN_RE = re.compile(r'\s*Channel:\s*(\d+)')
 
 
 def monitor_ssid(ssid, timeout=10, count=10, delay=1):
@@ -27,19 +55,21 @@ def monitor_ssid(ssid, timeout=10, count=10, delay=1):
         count (int): Number of rows to print in the table.
         delay (int): Delay in seconds between each row.
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from .scan import get_wifi_networks, _OS_ARG
+
     # Use common scan function to get all networks
-    networks_dict = get_wifi_networks(timeout)
-    connected_id = networks_dict.get('current')
+    networks_dict, connected_id, raw_output = get_wifi_networks(timeout, target_os=_OS_ARG, raw=True)
 
     # If no SSID specified, prompt user to pick one
     ssid_id = None
     freq = None
     if not ssid:
-        print(f"{Fore.YELLOW}Available WiFi Networks:{Style.RESET_ALL}")
-        ssid_ids = [k for k in networks_dict.keys() if k != 'current']
+        print(f"{YELLOW}Available WiFi Networks:{RESET}")
+        ssid_ids = list(networks_dict)
         for idx, unique_id in enumerate(ssid_ids, 1):
             net = networks_dict[unique_id]
-            star = f"{Fore.YELLOW}*{Style.RESET_ALL}" if unique_id == connected_id else " "
+            star = _STAR_ON if unique_id == connected_id else _STAR_OFF
             print(f"{star} [{idx}] {net['ssid']} (Freq: {net['freq']}, Channel: {net['channel']}, Band: {net['band']})")
         choice = input(f"Select network to monitor [1-{len(ssid_ids)}]: ")
         try:
@@ -48,19 +78,19 @@ def monitor_ssid(ssid, timeout=10, count=10, delay=1):
             ssid = networks_dict[ssid_id]['ssid']
             freq = networks_dict[ssid_id]['freq']
         except (ValueError, IndexError):
-            print(f"{Fore.RED}Invalid selection.{Style.RESET_ALL}")
+            print(f"{RED}Invalid selection.{RESET}")
             return
     else:
         # Find all matching SSIDs
-        matches = [uid for uid, net in networks_dict.items() if net['ssid'] == ssid and uid != 'current']
+        matches = _index_by_ssid(networks_dict).get(ssid, [])
         if not matches:
-            print(f"{Fore.RED}SSID '{ssid}' not found!{Style.RESET_ALL}")
+            print(f"{RED}SSID '{ssid}' not found!{RESET}")
             return
         if len(matches) > 1:
-            print(f"{Fore.YELLOW}Multiple networks found for SSID '{ssid}':{Style.RESET_ALL}")
+            print(f"{YELLOW}Multiple networks found for SSID '{ssid}':{RESET}")
             for idx, unique_id in enumerate(matches, 1):
                 net = networks_dict[unique_id]
-                star = f"{Fore.YELLOW}*{Style.RESET_ALL}" if unique_id == connected_id else " "
+                star = _STAR_ON if unique_id == connected_id else _STAR_OFF
                 print(f"{star} [{idx}] {net['ssid']} (Freq: {net['freq']}, Channel: {net['channel']}, Band: {net['band']})")
             choice = input(f"Select network to monitor [1-{len(matches)}]: ")
             try:
@@ -69,23 +99,41 @@ def monitor_ssid(ssid, timeout=10, count=10, delay=1):
                 ssid = networks_dict[ssid_id]['ssid']
                 freq = networks_dict[ssid_id]['freq']
             except (ValueError, IndexError):
-                print(f"{Fore.RED}Invalid selection.{Style.RESET_ALL}")
+                print(f"{RED}Invalid selection.{RESET}")
                 return
         else:
             ssid_id = matches[0]
             freq = networks_dict[ssid_id]['freq']
 
-    print(f"{Fore.YELLOW}Monitoring SSID '{ssid}' ({count} samples, {delay}s interval)...{Style.RESET_ALL}")
+    print(f"{YELLOW}Monitoring SSID '{ssid}' ({count} samples, {delay}s interval)...{RESET}")
     print_monitor_table_header()
+    # Rescan in a background worker; each sample uses the newest finished scan
+    # so the row cadence follows delay rather than delay + scan time
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(get_wifi_networks, timeout=2, target_os=_OS_ARG, raw=True)
+    fresh = True  # the initial scan has not been shown yet
     for i in range(count):
+        started = time.monotonic()
         try:
-            # Refresh scan each time for live stats
-            networks_dict = get_wifi_networks(timeout=2)
+            if future.done():
+                try:
+                    networks_dict, connected_id, raw_output = future.result()
+                    fresh = True
+                finally:
+                    future = executor.submit(get_wifi_networks, timeout=2, target_os=_OS_ARG, raw=True)
             net = networks_dict.get(ssid_id)
             if net:
-                # Simulate connection info (mocked)
-                connected = True
-                retries = invalid_beacon = invalid_crypt = invalid_frag = 0
+                # Connection details come from the same scan output (no second scan)
+                info = get_current_network_info(raw_output, ssid) if raw_output else None
+                if info:
+                    connected = True
+                    retries = info["retries"]
+                    invalid_beacon = info["invalid_beacon"]
+                    invalid_crypt = info["invalid_crypt"]
+                    invalid_frag = info["invalid_frag"]
+                else:
+                    connected = connected_id == ssid_id
+                    retries = invalid_beacon = invalid_crypt = invalid_frag = 0
                 row = {
                     "signal": net["rssi"],
                     "freq": net["freq"],
@@ -100,74 +148,123 @@ def monitor_ssid(ssid, timeout=10, count=10, delay=1):
             else:
                 row = {"signal": "N/A", "freq": "N/A", "channel": "N/A", "band": "N/A", "connected": False, "retries": "-", "invalid_beacon": "-", "invalid_crypt": "-", "invalid_frag": "-"}
         except Exception as e:
-            print(f"{Fore.RED}Error monitoring WiFi: {e}{Style.RESET_ALL}")
+            print(f"{RED}Error monitoring WiFi: {e}{RESET}")
             row = {"signal": "ERR", "freq": "ERR", "channel": "ERR", "band": "ERR", "connected": False, "retries": "-", "invalid_beacon": "-", "invalid_crypt": "-", "invalid_frag": "-"}
+        # Rows that reuse an already-shown scan (rescan still running) are marked stale
+        row["stale"] = not fresh
+        fresh = False
         print_monitor_table_row(i+1, row)
-        time.sleep(delay)
+        # Sleep only for what is left of the interval
+        time.sleep(max(0, delay - (time.monotonic() - started)))
+    executor.shutdown(wait=False)
+
+def _index_by_ssid(networks_dict):
+    """
+    Build a reverse index of SSID -> list of unique_ids from a scan result.
+    """
+    index = {}
+    for uid, net in networks_dict.items():
+        index.setdefault(net['ssid'], []).append(uid)
+    return index
+
+
+def _write_bytes(data):
+    """
+    Write pre-encoded bytes to stdout, falling back to text mode when stdout
+    has no binary buffer (e.g. captured output in tests).
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(bytes(data).decode())
+        return
+    # Flush pending text first so output ordering is preserved
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
 
 def print_monitor_table_header():
     """
     Print the header for the monitor table.
     """
-    print(f"{Fore.CYAN}{'Sample':<8} {'Signal':<8} {'Freq':<8} {'Channel':<8} {'Band':<7} {'Conn':<6} {'Retries':<8} {'InvBeacon':<10} {'InvCrypt':<9} {'InvFrag':<8}{Style.RESET_ALL}")
+    _write_bytes(_MONITOR_HEADER)
 
 def print_monitor_table_row(i, row):
     """
     Print a single row for the monitor table.
+    Stale rows (reusing the previous scan) get a '*' after the sample number.
     """
-    band_color = Fore.LIGHTGREEN_EX if row["band"] == "2.4GHz" else Fore.LIGHTMAGENTA_EX
-    conn_color = Fore.GREEN if row["connected"] else Fore.RED
-    print(f"{Fore.WHITE}{i:<8} {row['signal']:<8} {row['freq']:<8} {row['channel']:<8} {band_color}{row['band']:<7} {conn_color}{str(row['connected']):<6} {Fore.YELLOW}{row['retries']:<8} {row['invalid_beacon']:<10} {row['invalid_crypt']:<9} {row['invalid_frag']:<8}{Style.RESET_ALL}")
-
+    sample = f"{i}*" if row.get("stale") else i
+    buf = bytearray(_FG_WHITE)
+    buf += f"{sample:<8} {row['signal']:<8} {row['freq']:<8} {row['channel']:<8} ".encode()
+    buf += _FG_LGREEN if row["band"] == "2.4GHz" else _FG_LMAGENTA
+    buf += f"{row['band']:<7} ".encode()
+    buf += _CONN[row["connected"]]
+    buf += _FG_YELLOW
+    buf += f"{row['retries']:<8} {row['invalid_beacon']:<10} {row['invalid_crypt']:<9} {row['invalid_frag']:<8}".encode()
+    buf += _RESET_NL
+    # Single write + flush per row so live samples appear immediately
+    _write_bytes(buf)
 
 def get_current_network_info(output, ssid):
     """
     Parse current network info for the given SSID from system_profiler output.
     Returns dict with error rates (mocked for now).
     """
-    in_current = False
+    from .scan import channel_to_freq, _BAND_BY_CHAN
+
+    # Jump to the section with one find; the rest of the header line is skipped
+    start = output.find(_CUR_HEADER)
+    if start < 0:
+        return None
     info = {}
-    for line in output.splitlines():
-        if "Current Network Information:" in line:
-            in_current = True
-            continue
-        if in_current:
-            if ssid is not None and line.strip().startswith(ssid + ":"):
-                info["connected"] = True
-            if "Signal / Noise:" in line:
-                info["signal"] = (
-                    line.split(":", 1)[1]
-                    .strip()
-                    .split("/")[0]
-                    .strip()
-                    .replace(" dBm", "")
-                )
-            if "Channel:" in line:
-                info["channel"] = line.split(":", 1)[1].strip().split(" ")[0]
+    ssid_prefix = ssid + ":" if ssid is not None else None
+    lines = io.StringIO(output[start:])
+    next(lines)
+    for line in lines:
+        line = line.rstrip("\n")
+        stripped = line.strip()
+        if ssid_prefix is not None and stripped.startswith(ssid_prefix):
+            info["connected"] = True
+        m = _SIG_RE.match(line)
+        if m:
+            info["signal"] = m.group(1)
+        else:
+            m = _CHAN_RE.match(line)
+            if m:
+                info["channel"] = m.group(1)
                 info["freq"] = channel_to_freq(info["channel"])
-                info["band"] = (
-                    "2.4GHz"
-                    if info["channel"].isdigit() and 1 <= int(info["channel"]) <= 14
-                    else "5GHz"
-                )
-            # Mock error rates
-            info["retries"] = 0
-            info["invalid_beacon"] = 0
-            info["invalid_crypt"] = 0
-            info["invalid_frag"] = 0
-            if line.strip() == "":
-                break
+                info["band"] = _BAND_BY_CHAN.get(info["channel"], "5GHz")
+        # Mock error rates
+        info["retries"] = 0
+        info["invalid_beacon"] = 0
+        info["invalid_crypt"] = 0
+        info["invalid_frag"] = 0
+        if not stripped or stripped == "Other Local Wi-Fi Networks:":
+            # End of the Current Network block; skip the rest of the output
+            return info if "connected" in info else None
     return info if "connected" in info else None
 
 
 def print_wifi_status(net, connected, info):
     """
     Print WiFi status for the SSID, including error rates if connected.
+    The last rendered text is cached, so an unchanged status is re-emitted
+    without formatting it again.
     """
-    print(
-        f"{Fore.CYAN}SSID: {net['ssid']:<32} Signal: {net['rssi']:<8} Freq: {net['freq']:<8} Channel: {net['channel']:<8} Band: {net['band']:<7}{Style.RESET_ALL}"
-    )
     if connected and info:
-        print(
-            f"{Fore.LIGHTRED_EX}Error Rates: Retries={info['retries']} InvalidBeacon={info['invalid_beacon']} InvalidCrypt={info['invalid_crypt']} InvalidFrag={info['invalid_frag']}{Style.RESET_ALL}"
-        )
+        rates = (info['retries'], info['invalid_beacon'], info['invalid_crypt'], info['invalid_frag'])
+    else:
+        rates = None
+    key = (net['ssid'], net['rssi'], net['freq'], net['channel'], net['band'], rates)
+    cache = print_wifi_status._last_cache
+    if cache.get('k') != key:
+        text = f"{CYAN}SSID: {net['ssid']:<32} Signal: {net['rssi']:<8} Freq: {net['freq']:<8} Channel: {net['channel']:<8} Band: {net['band']:<7}{RESET}\n"
+        if rates:
+            text += f"{LRED}Error Rates: Retries={rates[0]} InvalidBeacon={rates[1]} InvalidCrypt={rates[2]} InvalidFrag={rates[3]}{RESET}\n"
+        cache['k'] = key
+        cache['s'] = text
+    sys.stdout.write(cache['s'])
+
+
+print_wifi_status._last_cache = {}
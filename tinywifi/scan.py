@@ -4,7 +4,7 @@
 WiFi scanning and analysis functions for TinyWiFi CLI tool.
 
 Features:
-- Scans for WiFi SSIDs and reports signal, frequency, channel, and band (2.4GHz/5GHz).
+- Scans for WiFi SSIDs and reports signal, frequency, channel, and band (2.4GHz/5GHz/6GHz).
 - Uses macOS system_profiler for cross-platform compatibility.
 - Colorized table output using colorama.
 - Functions for converting between channel and frequency.
@@ -14,155 +14,418 @@ Author: Jason A. Cox
 github.com/jasonacox/tinywifi
 """
 
+import csv
+import io
 import re
+import shutil
 import subprocess
 import time
 import platform
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 
 from colorama import Fore, Style, init
 
+try:
+    # Optional: pyobjc-framework-CoreWLAN (pip install tinywifi[macos])
+    from CoreWLAN import CWWiFiClient
+except ImportError:
+    CWWiFiClient = None
+
 init(autoreset=True)
 
-def get_wifi_networks(timeout=5, target_os="macos"):
+# Shared CoreWLAN client, created once (None when PyObjC/CoreWLAN is not available)
+_CW_CLIENT = CWWiFiClient.sharedWiFiClient() if CWWiFiClient is not None else None
+
+# CoreWLAN kCWChannelBand* values
+_CW_BANDS = {1: "2.4GHz", 2: "5GHz", 3: "6GHz"}
+
+# CoreWLAN kCWSecurity* values, strongest first, with system_profiler-style names
+_CW_SECURITY = (
+    (12, "WPA3 Enterprise"),
+    (11, "WPA3 Personal"),
+    (13, "WPA2/WPA3 Personal"),
+    (9, "WPA2 Enterprise"),
+    (4, "WPA2 Personal"),
+    (7, "WPA Enterprise"),
+    (2, "WPA Personal"),
+    (1, "WEP"),
+    (0, "None"),
+)
+
+# Host OS, detected once at import, mapped to the get_wifi_networks() target_os
+# name (None when unsupported)
+_SYS_OS = platform.system().lower()
+_OS_ARG = {"darwin": "macos", "macos": "macos", "linux": "linux", "windows": "windows"}.get(_SYS_OS)
+
+# Whether we already run as root, so sudo retries can be skipped (no geteuid on Windows)
+_IS_ROOT = hasattr(os, "geteuid") and os.geteuid() == 0
+
+# Text decoding for Linux scan tool output: always UTF-8 (what nmcli prints SSIDs in)
+# with undecodable bytes replaced, rather than the locale codec with strict errors,
+# where one non-ASCII SSID under a C locale would fail the whole scan
+_LINUX_TEXT = {"encoding": "utf-8", "errors": "replace"}
+
+# Wireless interface found by _detect_linux_interface() (None until one is found)
+_LINUX_INTERFACE = None
+
+# Commands _have_tool() found on PATH; misses are not kept
+_FOUND_TOOLS = set()
+
+# Linux tools (argv[0]) that only worked through sudo; later scans go straight to sudo
+_NEEDS_SUDO = set()
+
+# Held while a command runs under sudo, so tools scanned concurrently never show
+# two password prompts at once (the second usually reuses sudo's cached credentials)
+_SUDO_LOCK = threading.Lock()
+
+# sudo prefix for those retries. Without a terminal nobody can answer a password
+# prompt, so sudo runs non-interactively (-n): it fails at once instead of blocking,
+# while passwordless (NOPASSWD) rules keep working.
+_SUDO_ARGV = ["sudo"] if sys.stdin is not None and sys.stdin.isatty() else ["sudo", "-n"]
+
+# Band lookup by channel string: channels 1-14 are 2.4GHz, everything else defaults to 5GHz.
+# The band rule for parsers that only know the channel (shared with monitor.py); parsers
+# that know the frequency use _band_for_freq(), since 6GHz reuses channel numbers 1-14.
+_BAND_BY_CHAN = {str(c): "2.4GHz" for c in range(1, 15)}
+
+# system_profiler 'Other Local Wi-Fi Networks' lines, one alternative per kind so a
+# match is dispatched on m.lastgroup: indented Channel / Signal fields (capturing the
+# channel number or signal dBm), or a less indented "Name:" header starting a network
+_PROFILER_RE = re.compile(
+    r"(?P<ch>^ {14,}Channel:[ \t]*(?P<chan>\d+))"
+    r"|(?P<sig>^ {14,}Signal / Noise:[ \t]*(?P<rssi>-?\d+))"
+    r"|(?P<hdr>^ {0,13}(?P<ssid>\S.*?):[ \t]*$)",
+    re.MULTILINE,
+)
+
+# colorama codes used by print_table, bound once instead of per-row attribute lookups
+_FG_GREEN, _FG_YELLOW, _FG_RED, _FG_WHITE = Fore.GREEN, Fore.YELLOW, Fore.RED, Fore.WHITE
+_FG_BLUE, _FG_MAGENTA, _FG_CYAN = Fore.BLUE, Fore.MAGENTA, Fore.CYAN
+_FG_LBLACK, _FG_LWHITE = Fore.LIGHTBLACK_EX, Fore.LIGHTWHITE_EX
+_FG_LGREEN, _FG_LMAGENTA = Fore.LIGHTGREEN_EX, Fore.LIGHTMAGENTA_EX
+_RESET = Style.RESET_ALL
+
+# Suffix print_table drops from security labels ("WPA2 Personal" -> "WPA2")
+_PERSONAL_SUFFIX = "Personal"
+
+# Channel -> center frequency (MHz) for the supported 2.4GHz and 5GHz channels
+_CHAN_TO_FREQ = {ch: 2412 + (ch - 1) * 5 for ch in range(1, 14)}
+_CHAN_TO_FREQ[14] = 2484  # Special case for channel 14
+# 5 GHz lower, middle (DFS) and upper bands
+_CHAN_TO_FREQ.update(
+    {ch: 5000 + ch * 5 for ch in [*range(36, 65), *range(100, 145), *range(149, 166)]}
+)
+
+# Frequency (MHz) -> channel string; covers every integer MHz in the 2.4GHz, 5GHz and 6GHz ranges
+_FREQ_TO_CHAN = {f: str((f - 2407) // 5) for f in range(2412, 2473)}
+_FREQ_TO_CHAN.update({f: str((f - 5000) // 5) for f in range(5180, 5826)})
+_FREQ_TO_CHAN.update({f: str((f - 5950) // 5) for f in range(5955, 7116)})
+_FREQ_TO_CHAN[2484] = "14"  # Same special case as _CHAN_TO_FREQ
+
+# macOS 'Channel:' values, e.g. '149 (5GHz, 80MHz)' -> channel and GHz
+_CHANNEL_GHZ_RE = re.compile(rb"(\d+)\s*\((\d+)GHz")
+
+# system_profiler command and its last result as (monotonic finish time,
+# CompletedProcess); only kept when a caller opts in with cache_ttl
+_PROFILER_ARGV = ("system_profiler", "SPAirPortDataType")
+_PROFILER_CACHE = None
+
+# 'Current Network Information' section: the connected SSID header and the block of
+# field lines indented below it, then the two fields read from that block
+_CURRENT_NETWORK_RE = re.compile(
+    rb"Current Network Information:[ \t]*\r?\n"
+    rb"(?:[ \t]*\r?\n)*"
+    rb"(?P<indent>[ \t]*)(?P<ssid>\S[^\r\n]*?):[ \t]*\r?\n"
+    rb"(?P<fields>(?:(?P=indent)[ \t]+\S[^\r\n]*(?:\r?\n|$))*)"
+)
+_CURRENT_CHANNEL_RE = re.compile(rb"^[ \t]*Channel:[ \t]*(\d+)", re.MULTILINE)
+_CURRENT_RATE_RE = re.compile(rb"^[ \t]*Transmit Rate:[ \t]*([^\r\n]*?)[ \t]*\r?$", re.MULTILINE)
+
+# iwlist scan fields, one named group per field so matches dispatch on m.lastgroup.
+# A 'Cell NN - Address:' line starts a new network; 'Signal level' also covers
+# readings without a dBm unit.
+_RE_IWLIST = re.compile(
+    r"Cell\s+\d+\s+-\s+Address:\s*(?P<bssid>[0-9A-Fa-f:]+)"
+    r"|Frequency:\s*(?P<freq>\d+(?:\.\d+)?)\s*GHz"
+    r"|Channel:\s*(?P<ch>\d+)"
+    r"|Signal level=(?P<sig>-?\d+(?:\.\d+)?)"
+    r"|Noise level=(?P<noise>-?\d+(?:\.\d+)?)"
+    r"|ESSID:\"(?P<essid>[^\"\n]*)\""
+    r"|Mode:(?P<mode>\w+)"
+    r"|Encryption key:(?P<enc>on|off)"
+)
+
+# nmcli commands: the terse network list (fields in the order _parse_nmcli_lines()
+# unpacks them) and the rescan request
+_NMCLI_FIELDS = "ACTIVE,SSID,BSSID,SIGNAL,CHAN,FREQ,MODE,RATE,SECURITY"
+_NMCLI_LIST_ARGV = ("nmcli", "-t", "-f", _NMCLI_FIELDS, "device", "wifi", "list")
+_NMCLI_RESCAN_ARGV = ("nmcli", "device", "wifi", "rescan")
+
+# nmcli terse (-t) output as a csv dialect: ':' separated, with ':' and '\\' escaped
+# by a backslash. nmcli never quotes, so quote characters in SSIDs stay literal.
+_NMCLI_CSV = {"delimiter": ":", "escapechar": "\\", "quoting": csv.QUOTE_NONE}
+
+# Header of the system_profiler section listing nearby networks
+_OTHER_NETWORKS_HEADER = b"Other Local Wi-Fi Networks:"
+
+# system_profiler indentation under 'Other Local Wi-Fi Networks': SSID headers
+# sit at column 12, their fields at column 14
+_INDENT_SSID = 12
+_INDENT_FIELD = 14
+
+# Band label for the GHz value system_profiler reports next to the channel
+_BAND_BY_GHZ = {2: "2.4GHz", 5: "5GHz", 6: "6GHz"}
+
+def get_wifi_networks(timeout=5, target_os="macos", raw=False, cache_ttl=0):
     """
     Scan for WiFi networks and return a dict of unique networks keyed by SSID+freq, and the unique_id of the currently connected SSID.
     Args:
-        timeout (int): Total time in seconds to scan (multiple scans).
+        timeout (int): Total time in seconds to scan (multiple scans on macOS, one rescan window on Linux).
         target_os (str): Target operating system ("macos", "linux", "windows").
+        raw (bool): Also return the raw scan output so callers can parse it further without rescanning.
+        cache_ttl (float): Reuse system_profiler output younger than this many seconds (0 disables).
     Returns:
         Tuple[Dict[str, dict], str]: Dict of network info keyed by unique_id ("SSID_freq"), and the connected unique_id (or None).
+        If raw is True, returns (networks_dict, connected_id, raw_output) where raw_output is the last system_profiler output (None if unavailable).
+    """
+    scanner = _SCANNERS.get(target_os)
+    if scanner is None:
+        if target_os == "windows":
+            # Windows logic (placeholder)
+            raise NotImplementedError("Windows WiFi scanning not implemented yet.")
+        raise ValueError(f"Unknown OS: {target_os}")
+    all_networks, connected_unique_id, raw_output = scanner(max(1, timeout // 2), raw, cache_ttl)
+    return (all_networks, connected_unique_id, raw_output) if raw else (all_networks, connected_unique_id)
+
+
+def _scan_macos(scans, raw=False, cache_ttl=0):
+    """
+    macOS scanner for get_wifi_networks(): native CoreWLAN scan when PyObjC is
+    available, otherwise system_profiler SPAirPortDataType.
+    
+    Args:
+        scans (int): Number of scans to merge
+        raw (bool): Also keep the decoded system_profiler output
+        cache_ttl (float): Reuse system_profiler output younger than this many seconds
+        
+    Returns:
+        Tuple[Dict[str, dict], str, str]: Networks keyed by unique_id, the connected
+        unique_id (or None), and the raw output (or None)
     """
     all_networks = {}
-    scans = max(1, timeout // 2)
     connected_unique_id = None
-    if target_os == "macos":
-        # macOS logic using system_profiler SPAirPortDataType
-        for i in range(scans):
-            try:
-                result = subprocess.run(
-                    ["system_profiler", "SPAirPortDataType"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                
-                # Parse networks from system_profiler output
-                networks = _parse_macos_networks(result.stdout)
-                
-                # Add networks to our collection
-                for net in networks:
-                    unique_id = f"{net['ssid']}_{net['freq']}"
+    raw_output = None
+    # One worker runs system_profiler scans back to back; the next scan is
+    # queued before the current one is parsed so parsing overlaps the scan.
+    # It is only started once a second scan is actually queued.
+    executor = None
+    pending = None
+
+    def queue_scan():
+        nonlocal executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+        return executor.submit(_run_system_profiler, cache_ttl)
+
+    connected_rate = None
+    unchanged = 0  # consecutive rescans that found no new network
+    if _cached_system_profiler(cache_ttl) is not None:
+        # Rescans would only re-read the same cached output
+        scans = 1
+    for i in range(scans):
+        started = time.monotonic()
+        paced = True
+        try:
+            corewlan = _get_macos_corewlan_networks()
+            if corewlan is not None:
+                networks, connected_id, rate_info = corewlan
+            else:
+                future, pending = pending, None
+                result = future.result() if future is not None else _run_system_profiler(cache_ttl)
+                if i < scans - 1 and unchanged == 0:
+                    # This result cannot end the loop, so queue the next scan now
+                    pending = queue_scan()
+                # The queued scan paces the loop, so no sleep is needed
+                paced = False
+
+                if raw:
+                    raw_output = result.stdout.decode("utf-8", "replace")
+
+                networks, connected_id, rate_info = _parse_macos_profiler(result.stdout, connected=(i == 0))
+
+            # Add networks to our collection, keeping the strongest reading
+            # of each network seen across scans
+            known = len(all_networks)
+            for net in networks:
+                unique_id = f"{net['ssid']}_{net['freq']}"
+                best = all_networks.get(unique_id)
+                if best is None or net['rssi'] > best['rssi']:
                     all_networks[unique_id] = net
-                
-                # Only on first scan, find the currently connected network
-                if i == 0:
-                    connected_unique_id = _parse_macos_connected_network(result.stdout)
-                    
-                    # Also try to extract rate information for the connected network
-                    if connected_unique_id and connected_unique_id in all_networks:
-                        rate_info = _extract_connected_rate(result.stdout)
-                        if rate_info:
-                            all_networks[connected_unique_id]['rate'] = rate_info + " Mbps"
-                    
-            except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
-                print(f"{Fore.RED}Error scanning WiFi: {e}{Style.RESET_ALL}")
-            
-            if i < scans - 1:
-                time.sleep(2)
-                
-        all_networks['current'] = connected_unique_id
-        return all_networks
-    elif target_os == "linux":
-        # Linux logic using multiple tools for comprehensive data
-        connected_unique_id = None
-        for i in range(scans):
+
+            # Only on first scan, record the currently connected network
+            if i == 0:
+                connected_unique_id = connected_id
+                connected_rate = rate_info
+            elif len(all_networks) > known:
+                unchanged = 0
+            else:
+                unchanged += 1
+                if unchanged >= 2:
+                    # Two scans in a row found nothing new, so further scans are unlikely to either
+                    break
+            if corewlan is None and pending is None and i < scans - 1:
+                # Held back above while this result could have ended the loop
+                pending = queue_scan()
+
+        except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
+            print(f"{Fore.RED}Error scanning WiFi: {e}{Style.RESET_ALL}")
+
+        if paced and i < scans - 1:
+            # Keep scans ~2s apart, counting the time the scan itself took
+            time.sleep(max(0, 2 - (time.monotonic() - started)))
+
+    if executor is not None:
+        if pending is not None:
+            pending.cancel()  # only succeeds if the queued scan has not started
+        executor.shutdown(wait=False)
+
+    # Attach rate information for the connected network (after merging, so
+    # a stronger reading from a later scan does not drop it)
+    if connected_unique_id and connected_unique_id in all_networks and connected_rate:
+        all_networks[connected_unique_id]['rate'] = connected_rate + " Mbps"
+    return all_networks, connected_unique_id, raw_output
+
+
+def _scan_linux(scans, raw=False, cache_ttl=0):
+    """
+    Linux scanner for get_wifi_networks(): iw first, then NetworkManager (nmcli)
+    merged with iwlist signal data.
+    
+    Args:
+        scans (int): Scan window in 2s steps for the NetworkManager rescan
+        raw (bool): Unused; there is no raw text output on Linux
+        cache_ttl (float): Unused; only system_profiler output is cached
+        
+    Returns:
+        Tuple[Dict[str, dict], str, None]: Networks keyed by unique_id, the connected
+        unique_id (or None), and None for the raw output
+    """
+    # Prefer a direct nl80211 scan with iw, which returns fresh results
+    # (and the associated BSS) without going through NetworkManager
+    iw_scan = _get_linux_iw_scan()
+    if iw_scan is not None:
+        return iw_scan + (None,)
+
+    # Fallback when iw is missing or not permitted: trigger one NetworkManager
+    # rescan, give it the same scan window the old polling loop used, then collect
+    # once. Repeated 'nmcli ... list' calls only re-read NetworkManager's cache, so
+    # polling added forks, not coverage.
+    _trigger_linux_rescan()
+    if scans > 1:
+        time.sleep(2 * (scans - 1))
+
+    all_networks = {}
+    connected_unique_id = None
+    # Both tools block on their own subprocess, so run iwlist (detailed signal
+    # information) in a worker while nmcli (additional info and active
+    # connections) runs here; _run_with_sudo_fallback() keeps their sudo
+    # retries from prompting at the same time
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        detailed = executor.submit(_get_linux_iwlist_networks)
+        networks_nmcli = _get_linux_nmcli_networks()
+        networks_detailed = detailed.result()
+
+        # Index iwlist data by BSSID, which identifies the exact access point, and
+        # by SSID (frequencies converted once) as a fallback for rows without one
+        iwlist_by_bssid = {}
+        iwlist_by_ssid = {}
+        for iwlist_net in networks_detailed:
+            if iwlist_net.get('bssid'):
+                iwlist_by_bssid[iwlist_net['bssid'].upper()] = iwlist_net
             try:
-                # First try iwlist for detailed signal information
-                networks_detailed = _get_linux_iwlist_networks()
-                
-                # Then get nmcli data for additional info and active connections
-                networks_nmcli = _get_linux_nmcli_networks()
-                
-                # Merge the data sources
-                for nmcli_net in networks_nmcli:
-                    unique_id = f"{nmcli_net['ssid']}_{nmcli_net['freq']}"
-                    
-                    # Look for matching network in iwlist data for enhanced signal info
-                    iwlist_match = None
-                    for iwlist_net in networks_detailed:
-                        try:
-                            # Convert frequencies to integers for comparison
-                            iwlist_freq = int(float(iwlist_net.get('freq', 0)))
-                            nmcli_freq = int(float(nmcli_net.get('freq', 0)))
-                            
-                            if (iwlist_net.get('ssid') == nmcli_net.get('ssid') and 
-                                abs(iwlist_freq - nmcli_freq) < 10):  # Allow small freq differences
-                                iwlist_match = iwlist_net
-                                break
-                        except (ValueError, TypeError):
-                            # Skip this comparison if frequency conversion fails
-                            continue
-                    
-                    # Combine data from both sources
-                    combined_net = nmcli_net.copy()
-                    if iwlist_match:
-                        # Use iwlist data for signal, noise if available
-                        if iwlist_match.get('rssi') != -100:
-                            combined_net['rssi'] = iwlist_match['rssi']
-                        if iwlist_match.get('noise') is not None:
-                            combined_net['noise'] = iwlist_match['noise']
-                        if iwlist_match.get('snr') is not None:
-                            combined_net['snr'] = iwlist_match['snr']
-                    
-                    all_networks[unique_id] = combined_net
-                    
-                    # Check if this is the active connection
-                    if nmcli_net.get('active'):
-                        connected_unique_id = unique_id
-                        
-            except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
-                print(f"{Fore.RED}Error scanning WiFi: {e}{Style.RESET_ALL}")
-            
-            if i < scans - 1:
-                time.sleep(2)
-                
-        all_networks['current'] = connected_unique_id
-        return all_networks
-    elif target_os == "windows":
-        # Windows logic (placeholder)
-        raise NotImplementedError("Windows WiFi scanning not implemented yet.")
-    else:
-        raise ValueError(f"Unknown OS: {target_os}")
+                iwlist_freq = int(float(iwlist_net.get('freq', 0)))
+            except (ValueError, TypeError):
+                # Skip entries whose frequency cannot be compared
+                continue
+            iwlist_by_ssid.setdefault(iwlist_net.get('ssid'), []).append((iwlist_freq, iwlist_net))
+
+        # Merge the data sources
+        for nmcli_net in networks_nmcli:
+            unique_id = f"{nmcli_net['ssid']}_{nmcli_net['freq']}"
+
+            # Look for matching network in iwlist data for enhanced signal info:
+            # the same BSSID, else a same-SSID entry at (nearly) the same frequency
+            iwlist_match = iwlist_by_bssid.get(nmcli_net.get('bssid', '').upper())
+            try:
+                nmcli_freq = int(float(nmcli_net.get('freq', 0)))
+            except (ValueError, TypeError):
+                nmcli_freq = None
+            if iwlist_match is None and nmcli_freq is not None:
+                for iwlist_freq, iwlist_net in iwlist_by_ssid.get(nmcli_net.get('ssid'), ()):
+                    if abs(iwlist_freq - nmcli_freq) < 10:  # Allow small freq differences
+                        iwlist_match = iwlist_net
+                        break
+
+            # Combine data from both sources; nmcli records are built fresh for this
+            # merge, so they are updated in place rather than copied
+            combined_net = nmcli_net
+            if iwlist_match:
+                # Use iwlist data for signal, noise if available
+                if iwlist_match.get('rssi') != -100:
+                    combined_net['rssi'] = iwlist_match['rssi']
+                if iwlist_match.get('noise') is not None:
+                    combined_net['noise'] = iwlist_match['noise']
+                if iwlist_match.get('snr') is not None:
+                    combined_net['snr'] = iwlist_match['snr']
+
+            all_networks[unique_id] = combined_net
+
+            # Check if this is the active connection
+            if nmcli_net.get('active'):
+                connected_unique_id = unique_id
+
+    except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
+        print(f"{Fore.RED}Error scanning WiFi: {e}{Style.RESET_ALL}")
+    finally:
+        executor.shutdown(wait=False)
 
-def scan(timeout=5):
+    return all_networks, connected_unique_id, None
+
+
+# get_wifi_networks() target_os -> scanner(scans, raw, cache_ttl). The Linux
+# scanner ignores raw and cache_ttl: there is no raw text output to return and
+# only system_profiler output is cached.
+_SCANNERS = {"macos": _scan_macos, "linux": _scan_linux}
+
+
+def scan(timeout=5, cache_ttl=0, *, as_list=True):
     """
-    Scan WiFi networks on macOS using system_profiler.
+    Scan WiFi networks on the host OS (macOS or Linux) and print them as a table.
     Runs multiple scans over the given timeout (seconds) for better SSID coverage.
     Returns a list of unique networks found.
     Args:
         timeout (int): Total time in seconds to scan (multiple scans).
+        cache_ttl (float): Reuse system_profiler output younger than this many seconds (0 disables).
+        as_list (bool): Copy the results into a list; if False, return a view over the
+            scan's own dict instead (for callers that only print the table).
     Returns:
         List[dict]: List of network info dicts (ssid, rssi, channel, freq, band).
     """
     print(f"{Fore.YELLOW}Scanning for WiFi networks...{Style.RESET_ALL}")
-    # Detect OS
-    sys_os = platform.system().lower()
-    if sys_os.startswith("darwin") or sys_os == "macos":
-        os_arg = "macos"
-    elif sys_os == "linux":
-        os_arg = "linux"
-    elif sys_os == "windows":
-        os_arg = "windows"
-    else:
-        print(f"{Fore.RED}Unsupported OS: {sys_os}{Style.RESET_ALL}")
+    if _OS_ARG is None:
+        print(f"{Fore.RED}Unsupported OS: {_SYS_OS}{Style.RESET_ALL}")
         return []
-    networks_dict = get_wifi_networks(timeout, target_os=os_arg)
-    current_id = networks_dict.get('current')
+    networks_dict, current_id = get_wifi_networks(timeout, target_os=_OS_ARG, cache_ttl=cache_ttl)
     if not networks_dict:
         print(f"{Fore.RED}No WiFi networks found.{Style.RESET_ALL}")
         return []
-    print(f"{Fore.GREEN}Found {len(networks_dict) - 1} networks.{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}Found {len(networks_dict)} networks.{Style.RESET_ALL}")
     # Print current connected SSID with name, channel, and frequency
     if current_id:
         current_net = networks_dict.get(current_id, {})
@@ -172,7 +435,7 @@ def scan(timeout=5):
     print()
     # Print colorized table with current SSID marked
     print_table(networks_dict, current_id)
-    return [networks_dict[uid] for uid in networks_dict if uid != 'current']
+    return list(networks_dict.values()) if as_list else networks_dict.values()
 
 
 def parse_system_profiler_output(output):
@@ -185,121 +448,94 @@ def parse_system_profiler_output(output):
         List[dict]: List of network info dicts.
     """
     networks = []
-    in_other_networks = False
-    ssid = None
-    channel = None
-    signal = None
-    freq = None
-    for line in output.splitlines():
-        line = line.rstrip()
-        if "Other Local Wi-Fi Networks:" in line:
-            in_other_networks = True
-            continue
-        if in_other_networks:
-            if not line.strip():
-                ssid = channel = signal = freq = None
-                continue
-            if not line.startswith(" " * 14):
-                # New SSID
-                ssid = line.strip().rstrip(":")
-            elif "Channel:" in line:
-                channel = line.split(":", 1)[1].strip().split(" ")[0]
-            elif "Signal / Noise:" in line:
-                signal = (
-                    line.split(":", 1)[1]
-                    .strip()
-                    .split("/")[0]
-                    .strip()
-                    .replace(" dBm", "")
-                )
-            elif "(2GHz" in line or "(5GHz" in line:
-                # Try to extract frequency from channel line, e.g. 'Channel: 100 (5GHz, 80MHz)'
-                freq_match = re.search(r"\((\d+)GHz", line)
-                if freq_match:
-                    ghz = int(freq_match.group(1))
-                    if channel:
-                        try:
-                            ch = int(channel)
-                            freq = 2407 + ch * 5 if ghz == 2 else 5000 + ch * 5
-                        except (ValueError, TypeError):
-                            freq = None
-            if ssid and signal and (channel or freq):
-                if not channel and freq:
-                    channel = freq_to_channel(freq)
-                freq_val = channel_to_freq(channel) if channel else freq
-                band = (
-                    "2.4GHz"
-                    if channel and channel.isdigit() and 1 <= int(channel) <= 14
-                    else "5GHz"
-                )
-                networks.append(
-                    {
-                        "ssid": ssid,
-                        "rssi": int(signal),
-                        "channel": channel if channel else "Unknown",
-                        "freq": freq_val if freq_val else "Unknown",
-                        "band": band,
-                    }
-                )
-                ssid = channel = signal = freq = None
-        # End parsing if we hit another section
-        if in_other_networks and (
-            line.strip().endswith("Networks:") and not line.strip().startswith("Other")
-        ):
-            break
+    section = output.partition("Other Local Wi-Fi Networks:")[2]
+    ssid = channel = signal = None
+    # One compiled multiline pass over the section instead of per-line string probes.
+    # A network is emitted only when the next SSID header (or the end) is reached.
+    for m in _PROFILER_RE.finditer(section):
+        kind = m.lastgroup
+        if kind == "ch":
+            channel = m.group("chan")
+        elif kind == "sig":
+            signal = m.group("rssi")
+        else:
+            # New SSID header: flush the previous network, start the next one
+            if ssid and signal and channel:
+                networks.append(_profiler_network(ssid, channel, signal))
+            ssid = m.group("ssid")
+            channel = signal = None
+    if ssid and signal and channel:
+        networks.append(_profiler_network(ssid, channel, signal))
     return networks
 
 
+def _profiler_network(ssid, channel, signal):
+    """
+    Build a parse_system_profiler_output() entry from its parsed fields.
+    """
+    freq_val = channel_to_freq(channel)
+    return {
+        "ssid": ssid,
+        "rssi": int(signal),
+        "channel": channel,
+        "freq": freq_val if freq_val else "Unknown",
+        "band": _BAND_BY_CHAN.get(channel, "5GHz"),
+    }
+
+
+@lru_cache(maxsize=256)
 def freq_to_channel(freq):
     """
     Convert frequency (MHz) to WiFi channel number.
+    Results are memoized per input value (str or int), so repeated lookups
+    skip int() parsing and the exception path for values like '--'.
     Args:
         freq (int or str): Frequency in MHz.
     Returns:
         str: Channel number or 'Unknown'.
     """
     try:
-        freq = int(freq)
-        if 2412 <= freq <= 2472:
-            return str((freq - 2407) // 5)
-        elif 5180 <= freq <= 5825:
-            return str((freq - 5000) // 5)
-        else:
-            return "Unknown"
+        return _FREQ_TO_CHAN.get(int(freq), "Unknown")
     except (ValueError, TypeError):
         return "Unknown"
 
 
+@lru_cache(maxsize=256)
 def channel_to_freq(channel):
     """
     Convert WiFi channel number to frequency in MHz.
+    Memoized like freq_to_channel().
     Args:
         channel (int or str): WiFi channel number.
     Returns:
         int or str: Frequency in MHz or 'Unknown'.
     """
     try:
-        ch = int(channel)
-        if 1 <= ch <= 14:
-            # 2.4 GHz band - more accurate calculation
-            if ch == 14:
-                return 2484  # Special case for channel 14
-            else:
-                return 2412 + (ch - 1) * 5
-        elif 36 <= ch <= 64:
-            # 5 GHz lower band
-            return 5000 + ch * 5
-        elif 100 <= ch <= 144:
-            # 5 GHz middle band (DFS channels)
-            return 5000 + ch * 5
-        elif 149 <= ch <= 165:
-            # 5 GHz upper band
-            return 5000 + ch * 5
-        else:
-            return "Unknown"
+        return _CHAN_TO_FREQ.get(int(channel), "Unknown")
     except (ValueError, TypeError):
         return "Unknown"
 
+@lru_cache(maxsize=256)
+def _band_for_freq(freq, channel):
+    """
+    Classify the band from the frequency (MHz), falling back to the channel when the
+    frequency is not a number. Memoized like freq_to_channel().
+    Args:
+        freq (int or str): Frequency in MHz.
+        channel (str): Channel number.
+    Returns:
+        str: '2.4GHz', '5GHz' or '6GHz'.
+    """
+    try:
+        mhz = int(float(freq))
+    except (ValueError, TypeError):
+        return _BAND_BY_CHAN.get(channel, "5GHz")
+    if mhz < 3000:
+        return "2.4GHz"
+    # 6GHz starts above the last 5GHz channel (177 at 5885 MHz)
+    return "5GHz" if mhz < 5925 else "6GHz"
+
+
 def print_table(networks_dict, current_id=None):
     """
     Print a colorized table of WiFi networks.
@@ -307,21 +543,25 @@ def print_table(networks_dict, current_id=None):
         networks_dict (dict): Dictionary of network info keyed by unique_id.
         current_id (str): Unique ID of the currently connected SSID.
     """
-    if not networks_dict or all(k == 'current' for k in networks_dict):
-        print(f"{Fore.RED}No WiFi networks found.{Style.RESET_ALL}")
+    if not networks_dict:
+        print(f"{_FG_RED}No WiFi networks found.{_RESET}")
         return
 
-    # Sort by best signal (highest RSSI)
-    ssid_list = sorted(
-        [k for k in networks_dict.keys() if k != 'current'],
-        key=lambda k: networks_dict[k].get('rssi', -100), 
-        reverse=True
-    )
+    # Sort by best signal (highest RSSI); rssi is read once per row and the
+    # sort compares plain ints (stable, so ties keep scan order). The network
+    # dicts ride along so nothing below looks them up by id again.
+    ranked = [(net.get('rssi', -100), k, net) for k, net in networks_dict.items()]
+    ranked.sort(key=itemgetter(0), reverse=True)
 
-    # Check if optional data is available
-    show_bssid = any(networks_dict[k].get('bssid', '') for k in ssid_list)
-    show_noise = any(networks_dict[k].get('noise') is not None and networks_dict[k].get('noise') != -100 for k in ssid_list)
-    show_snr = any(networks_dict[k].get('snr') is not None for k in ssid_list)
+    # Check if optional data is available: one pass over the rows for all three
+    # columns, stopping as soon as every column is known to be shown
+    show_bssid = show_noise = show_snr = False
+    for _, _, net in ranked:
+        show_bssid = show_bssid or bool(net.get('bssid', ''))
+        show_noise = show_noise or net.get('noise') not in (None, -100)
+        show_snr = show_snr or net.get('snr') is not None
+        if show_bssid and show_noise and show_snr:
+            break
 
     # Build header based on available data
     header_parts = [('SSID', 24)]
@@ -342,25 +582,27 @@ def print_table(networks_dict, current_id=None):
         ('State', 8)
     ])
     
-    # Print the header
+    # Header line; rows use one format template built from the same column widths
     header_str = "".join(f"{name:<{width}} " for name, width in header_parts)
-    print(f"{Fore.CYAN}{header_str.rstrip()}{Style.RESET_ALL}")
+    lines = [f"{_FG_CYAN}{header_str.rstrip()}{_RESET}"]
+    format_row = " ".join(f"{{}}{{:<{width}}}" for _, width in header_parts).format
+    add_line = lines.append
 
-    for unique_id in ssid_list:
-        net = networks_dict[unique_id]
-        signal_val = net.get('signal')
-        rssi = net.get('rssi', -100)
+    for rssi, unique_id, net in ranked:
+        # Bind the lookup once per row; every field below is read through it
+        get = net.get
+        signal_val = get('signal')
         
         # Determine signal color based on strength
         # 	Signal strength: -58 dBm → Strong. (Closer to 0 is better; -30 is excellent, -60 is good, -70 is fair.)
 	    #   Noise level: -89 dBm → Low interference. (More negative is better.)
 	    #   SNR (Signal-to-Noise Ratio): 31 dB → Very good connection.
         if (signal_val is not None and signal_val >= 65) or rssi > -60:
-            color = Fore.GREEN
+            color = _FG_GREEN
         elif (signal_val is not None and signal_val >= 60) or (-66 < rssi <= -60):
-            color = Fore.YELLOW
+            color = _FG_YELLOW
         else:
-            color = Fore.RED
+            color = _FG_RED
             
         # Format signal display - only show dBm if we have real values
         if rssi != -100:
@@ -374,151 +616,296 @@ def print_table(networks_dict, current_id=None):
             signal_display = "--"
         
         # Format other fields
-        ssid_raw = net.get('ssid', '')
+        ssid_raw = get('ssid', '')
         ssid_display = ssid_raw[:21] + '...' if len(ssid_raw) > 24 else ssid_raw
-        ssid_color = Fore.GREEN if unique_id == current_id else Fore.WHITE
+        ssid_color = _FG_GREEN if unique_id == current_id else _FG_WHITE
         
-        security_val = net.get('security', '')
-        if security_val.endswith('Personal'):
-            security_val = security_val.replace('Personal', '').strip()
+        security_val = get('security', '')
+        if security_val.endswith(_PERSONAL_SUFFIX):
+            security_val = security_val[:-len(_PERSONAL_SUFFIX)].rstrip()
         security_val = security_val[:12]
         
-        band_color = Fore.LIGHTGREEN_EX if net.get("band") == "2.4GHz" else Fore.LIGHTMAGENTA_EX
+        band = get('band', '')
+        band_color = _FG_LGREEN if band == "2.4GHz" else _FG_LMAGENTA
         current = "Connected" if unique_id == current_id else ""
         
         # Format noise and SNR if available
-        noise_val = net.get('noise')
-        snr_val = net.get('snr')
+        noise_val = get('noise')
+        snr_val = get('snr')
         
         if noise_val is not None and noise_val != -100:
             noise_display = f"{noise_val} dB"
-            noise_color = Fore.LIGHTBLACK_EX
+            noise_color = _FG_LBLACK
         else:
             noise_display = "--"
-            noise_color = Fore.LIGHTBLACK_EX
+            noise_color = _FG_LBLACK
             
         if snr_val is not None:
             snr_display = f"{snr_val} dB"
             # Color SNR based on quality: >25 excellent, 15-25 good, <15 poor
             if snr_val > 25:
-                snr_color = Fore.GREEN
+                snr_color = _FG_GREEN
             elif snr_val >= 15:
-                snr_color = Fore.YELLOW
+                snr_color = _FG_YELLOW
             else:
-                snr_color = Fore.RED
+                snr_color = _FG_RED
         else:
             snr_display = "--"
-            snr_color = Fore.LIGHTBLACK_EX
+            snr_color = _FG_LBLACK
         
-        # Build the row based on available data
-        row_parts = [(ssid_color, ssid_display, 24)]
+        # Build the row (color, value pairs in header column order)
+        row_parts = [ssid_color, ssid_display]
         if show_bssid:
-            row_parts.append((Fore.LIGHTBLACK_EX, net.get('bssid',''), 18))
-        row_parts.append((color, signal_display, 14))
+            row_parts += (_FG_LBLACK, get('bssid',''))
+        row_parts += (color, signal_display)
         if show_noise:
-            row_parts.append((noise_color, noise_display, 8))
+            row_parts += (noise_color, noise_display)
         if show_snr:
-            row_parts.append((snr_color, snr_display, 8))
-        row_parts.extend([
-            (Fore.BLUE, str(net.get('freq','')), 8),
-            (Fore.MAGENTA, str(net.get('channel','')), 8),
-            (band_color, net.get('band',''), 7),
-            (Fore.CYAN, net.get('mode',''), 7),
-            (Fore.YELLOW, net.get('rate',''), 10),
-            (Fore.LIGHTWHITE_EX, security_val, 12),
-            (Fore.GREEN, current, 8)
-        ])
+            row_parts += (snr_color, snr_display)
+        row_parts += (
+            _FG_BLUE, str(get('freq','')),
+            _FG_MAGENTA, str(get('channel','')),
+            band_color, band,
+            _FG_CYAN, get('mode',''),
+            _FG_YELLOW, get('rate',''),
+            _FG_LWHITE, security_val,
+            _FG_GREEN, current,
+        )
+        add_line(format_row(*row_parts).rstrip() + _RESET)
+
+    # Emit the whole table with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _get_macos_corewlan_networks():
+    """
+    Scan for WiFi networks directly through Apple's CoreWLAN framework (via PyObjC).
+    Avoids spawning system_profiler and parsing its text output.
+    
+    Returns:
+        Tuple[List[dict], str, str] or None: Network dictionaries, connected unique_id
+        (or None), and connected transmit rate (or None). None if CoreWLAN is unavailable
+        or the scan fails, so callers can fall back to system_profiler.
+    """
+    if _CW_CLIENT is None:
+        return None
+    iface = _CW_CLIENT.interface()
+    if iface is None:
+        return None
+    results, error = iface.scanForNetworksWithName_error_(None, None)
+    if results is None:
+        return None
+    
+    networks = []
+    for n in results:
+        ssid = n.ssid()
+        if not ssid:
+            # Hidden network, or SSIDs withheld without Location Services permission
+            continue
+        channel = n.wlanChannel()
+        channel_num = str(channel.channelNumber()) if channel is not None else None
+        network = {
+            'ssid': ssid,
+            'bssid': n.bssid() or '',
+            'rssi': n.rssiValue(),
+            'noise': n.noiseMeasurement(),
+            'mode': "IBSS" if n.ibss() else "Infra",
+        }
+        if channel_num:
+            network['channel'] = channel_num
+            network['freq'] = _cw_channel_freq(channel)
+            network['band'] = _CW_BANDS.get(channel.channelBand(), "Unknown")
+        for mode, name in _CW_SECURITY:
+            if n.supportsSecurity_(mode):
+                network['security'] = name
+                break
+        networks.append(_finalize_network(network))
+    
+    connected_id = None
+    rate_info = None
+    ssid = iface.ssid()
+    channel = iface.wlanChannel()
+    if ssid and channel is not None:
+        connected_id = f"{ssid}_{_cw_channel_freq(channel)}"
+        rate = iface.transmitRate()
+        if rate:
+            rate_info = f"{rate:g}"
+    return networks, connected_id, rate_info
+
+
+def _cw_channel_freq(channel):
+    """
+    Center frequency (MHz) of a CoreWLAN CWChannel. The band is needed as well as
+    the number, since 6GHz reuses the 2.4GHz and 5GHz channel numbers.
+    
+    Args:
+        channel (CWChannel): Channel from a CoreWLAN network or interface
         
-        # Print the row
-        row_str = "".join(f"{color}{value:<{width}} " for color, value, width in row_parts)
-        print(f"{row_str.rstrip()}{Style.RESET_ALL}")
+    Returns:
+        int or str: Frequency in MHz or 'Unknown'
+    """
+    if _CW_BANDS.get(channel.channelBand()) == "6GHz":
+        return 5950 + 5 * channel.channelNumber()
+    return channel_to_freq(channel.channelNumber())
+
+
+def _cached_system_profiler(cache_ttl):
+    """
+    Return the cached system_profiler result if it is younger than cache_ttl
+    seconds, otherwise None.
+    """
+    if cache_ttl > 0:
+        hit = _PROFILER_CACHE
+        if hit and time.monotonic() - hit[0] < cache_ttl:
+            return hit[1]
+    return None
 
 
-def _parse_macos_networks(output):
+def _run_system_profiler(cache_ttl=0):
+    """
+    Run system_profiler SPAirPortDataType and return the completed process.
+    
+    Stdout is kept as bytes: the parsers only decode the values they store
+    (SSIDs may be UTF-8, every other field is ASCII).
+    
+    Args:
+        cache_ttl (float): Return the last result instead if it finished less
+            than this many seconds ago (0 always runs a new scan)
+        
+    Raises:
+        subprocess.CalledProcessError: If system_profiler fails
+    """
+    global _PROFILER_CACHE
+    hit = _cached_system_profiler(cache_ttl)
+    if hit is not None:
+        return hit
+    result = subprocess.run(
+        list(_PROFILER_ARGV),
+        capture_output=True,
+        check=True,
+    )
+    if cache_ttl > 0:
+        _PROFILER_CACHE = (time.monotonic(), result)
+    return result
+
+
+def _parse_macos_profiler(output, connected=True):
+    """
+    Parse system_profiler SPAirPortDataType output into networks and connection info.
+    
+    'Current Network Information' comes before 'Other Local Wi-Fi Networks', so the
+    output is split once at the second header and each section parser walks only
+    its own part; no line is visited twice.
+    
+    Args:
+        output (bytes): Raw output from system_profiler SPAirPortDataType
+        connected (bool): Also parse the connected network (skipped on rescans)
+        
+    Returns:
+        Tuple[List[dict], str, str]: Networks, connected unique_id and transmit rate
+        (both None if not connected or not requested)
+    """
+    current_part, _, other_part = output.partition(_OTHER_NETWORKS_HEADER)
+    # Feed the parser lazily instead of materializing a list of lines
+    networks = _parse_macos_networks(io.BytesIO(other_part))
+    connected_id = rate_info = None
+    if connected:
+        connected_id, rate_info = _parse_macos_connected_network(current_part)
+    return networks, connected_id, rate_info
+
+
+def _set_macos_channel(network, value):
+    """Set channel, freq and band from a value such as b'6 (2GHz, 20MHz)'."""
+    channel_match = _CHANNEL_GHZ_RE.search(value)
+    if channel_match:
+        network['channel'] = channel_match.group(1).decode()
+        network['freq'] = channel_to_freq(network['channel'])
+        network['band'] = _BAND_BY_GHZ.get(int(channel_match.group(2)), "Unknown")
+
+
+def _set_macos_signal_noise(network, value):
+    """Set rssi and noise from a value such as b'-48 dBm / -94 dBm'."""
+    signal_str, sep, noise_str = value.partition(b"/")
+    network['rssi'] = _parse_dbm(signal_str)
+    if sep:
+        network['noise'] = _parse_dbm(noise_str)
+
+
+def _set_macos_security(network, value):
+    """Set the security label."""
+    network['security'] = value.decode("utf-8", "replace")
+
+
+def _set_macos_mode(network, value):
+    """Set the network mode, shortening 'Infrastructure' to 'Infra'."""
+    network['mode'] = "Infra" if value.startswith(b"Infrastructure") else value.decode("utf-8", "replace")
+
+
+def _set_macos_rate(network, value):
+    """Set the transmit rate."""
+    network['rate'] = value.decode()
+
+
+# system_profiler network field name -> handler(network, value) for _parse_macos_networks()
+_MACOS_FIELD_HANDLERS = {
+    b"Channel": _set_macos_channel,
+    b"Signal / Noise": _set_macos_signal_noise,
+    b"Security": _set_macos_security,
+    b"Network Type": _set_macos_mode,
+    b"Transmit Rate": _set_macos_rate,
+}
+
+
+def _parse_macos_networks(lines):
     """
     Parse networks from the 'Other Local Wi-Fi Networks' section of system_profiler output.
     
     Args:
-        output (str): Raw output from system_profiler SPAirPortDataType
+        lines (iterable): Byte lines of system_profiler SPAirPortDataType output
+            following the 'Other Local Wi-Fi Networks:' header, with or without
+            line endings (e.g. a file object or pipe)
         
     Returns:
         List[dict]: List of network dictionaries
     """
     networks = []
-    lines = output.splitlines()
-    
-    # Find the start of "Other Local Wi-Fi Networks" section
-    in_networks_section = False
     current_network = {}
     
     for line in lines:
         line = line.rstrip()
         
-        if "Other Local Wi-Fi Networks:" in line:
-            in_networks_section = True
-            continue
-            
-        if not in_networks_section:
+        # Dispatch on the first byte: only indented lines carry network data
+        if line[:1] != b" ":
+            # Empty line (whitespace-only lines are empty after rstrip) ends a network
+            if not line:
+                if current_network and current_network.get('ssid'):
+                    networks.append(_finalize_network(current_network))
+                current_network = {}
+                continue
+            # Stop if we hit another major section
+            if b":" in line:
+                break
             continue
             
-        # Stop if we hit another major section
-        if line and not line.startswith(" ") and ":" in line and not line.startswith("            "):
-            break
-            
-        # Empty line or new network starts
-        if not line.strip():
-            if current_network and current_network.get('ssid'):
-                networks.append(_finalize_network(current_network))
-            current_network = {}
-            continue
+        # Measure the indentation once and branch on its depth
+        body = line.lstrip(b" ")
+        indent = len(line) - len(body)
             
+        # Network properties - indented to column 14; the most common line, so tested first
+        if indent >= _INDENT_FIELD:
+            key, sep, value = body.partition(b":")
+            if not sep:
+                continue
+            # One dict lookup per field line; fields nobody reads are skipped unstripped
+            handler = _MACOS_FIELD_HANDLERS.get(key.rstrip())
+            if handler is not None:
+                handler(current_network, value.strip())
+                
         # Network name (SSID) - starts at column 12, ends with ":"
-        if line.startswith("            ") and not line.startswith("              ") and line.endswith(":"):
+        elif indent >= _INDENT_SSID and body.endswith(b":"):
             if current_network and current_network.get('ssid'):
                 networks.append(_finalize_network(current_network))
-            current_network = {'ssid': line.strip()[:-1]}  # Remove the trailing ":"
-            continue
-            
-        # Network properties - indented further
-        if line.startswith("              ") and ":" in line:
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-            
-            if key == "Channel":
-                # Extract channel number and frequency band
-                channel_match = re.search(r"(\d+)\s*\((\d+)GHz", value)
-                if channel_match:
-                    current_network['channel'] = channel_match.group(1)
-                    ghz = int(channel_match.group(2))
-                    current_network['freq'] = channel_to_freq(current_network['channel'])
-                    current_network['band'] = f"{ghz}GHz" if ghz in [2, 5] else "Unknown"
-                    
-            elif key == "Signal / Noise":
-                # Extract signal and noise values
-                sig_noise = value.split("/")
-                if len(sig_noise) >= 1:
-                    signal_str = sig_noise[0].strip().replace(" dBm", "")
-                    try:
-                        current_network['rssi'] = int(signal_str)
-                    except ValueError:
-                        current_network['rssi'] = -100
-                        
-                if len(sig_noise) >= 2:
-                    noise_str = sig_noise[1].strip().replace(" dBm", "")
-                    try:
-                        current_network['noise'] = int(noise_str)
-                    except ValueError:
-                        current_network['noise'] = -100
-                        
-            elif key == "Security":
-                current_network['security'] = value
-                
-            elif key == "Network Type":
-                current_network['mode'] = "Infra" if value.startswith("Infrastructure") else value
-                
-            elif key == "Transmit Rate":
-                current_network['rate'] = value
+            current_network = {'ssid': body[:-1].decode("utf-8", "replace")}  # Remove the trailing ":"
                 
     # Don't forget the last network
     if current_network and current_network.get('ssid'):
@@ -527,85 +914,49 @@ def _parse_macos_networks(output):
     return networks
 
 
-def _parse_macos_connected_network(output):
+def _parse_dbm(text):
     """
-    Parse the currently connected network from system_profiler output.
+    Parse a dBm reading such as b' -48 dBm' into an int.
     
     Args:
-        output (str): Raw output from system_profiler SPAirPortDataType
+        text (bytes): Reading with optional surrounding whitespace and 'dBm' unit
         
     Returns:
-        str or None: Unique ID of connected network (ssid_freq) or None
+        int: Value in dBm, or -100 if it is not a number
     """
-    lines = output.splitlines()
-    in_current_section = False
-    ssid = None
-    channel = None
-    
-    for line in lines:
-        line = line.strip()
-        
-        if "Current Network Information:" in line:
-            in_current_section = True
-            continue
-            
-        if not in_current_section:
-            continue
-            
-        # Stop if we hit "Other Local Wi-Fi Networks:" or empty line after getting data
-        if "Other Local Wi-Fi Networks:" in line or (not line and ssid and channel):
-            break
-            
-        # SSID is the first line after "Current Network Information:" that ends with ":"
-        if line.endswith(":") and not any(x in line for x in ["PHY Mode", "Channel", "Country", "Network", "Security", "Signal", "Transmit", "MCS"]):
-            ssid = line[:-1]  # Remove trailing ":"
-            
-        elif line.startswith("Channel:"):
-            channel_info = line.split(":", 1)[1].strip()
-            channel_match = re.search(r"(\d+)", channel_info)
-            if channel_match:
-                channel = channel_match.group(1)
-                
-        # Once we have both SSID and channel, we can create the unique ID
-        if ssid and channel:
-            freq = channel_to_freq(channel)
-            return f"{ssid}_{freq}"
-            
-    return None
+    try:
+        # int() ignores surrounding whitespace, so only the unit needs removing
+        return int(text.replace(b"dBm", b""))
+    except ValueError:
+        return -100
 
 
-def _extract_connected_rate(output):
+def _parse_macos_connected_network(output):
     """
-    Extract the transmit rate from the current network information section.
+    Parse the currently connected network and its transmit rate from system_profiler
+    output.
     
     Args:
-        output (str): Raw output from system_profiler SPAirPortDataType
+        output (bytes): system_profiler SPAirPortDataType output preceding the
+            'Other Local Wi-Fi Networks:' header
         
     Returns:
-        str or None: Transmit rate or None if not found
+        Tuple[str, str]: Unique ID of connected network (ssid_freq) and transmit rate,
+        either of which may be None
     """
-    lines = output.splitlines()
-    in_current_section = False
-    
-    for line in lines:
-        line = line.strip()
-        
-        if "Current Network Information:" in line:
-            in_current_section = True
-            continue
-            
-        if not in_current_section:
-            continue
-            
-        # Stop if we hit "Other Local Wi-Fi Networks:" 
-        if "Other Local Wi-Fi Networks:" in line:
-            break
-            
-        if line.startswith("Transmit Rate:"):
-            rate_info = line.split(":", 1)[1].strip()
-            return rate_info
-            
-    return None
+    # One search finds the section, the SSID and its field block; the fields are
+    # then read with anchored searches instead of a per-line state machine
+    m = _CURRENT_NETWORK_RE.search(output)
+    if m is None:
+        return None, None
+    fields = m.group('fields')
+    rate_match = _CURRENT_RATE_RE.search(fields)
+    rate_info = rate_match.group(1).decode() if rate_match else None
+    channel_match = _CURRENT_CHANNEL_RE.search(fields)
+    if channel_match is None:
+        return None, rate_info
+    ssid = m.group('ssid').decode("utf-8", "replace")
+    return f"{ssid}_{channel_to_freq(channel_match.group(1).decode())}", rate_info
 
 
 def _finalize_network(network_dict):
@@ -618,12 +969,15 @@ def _finalize_network(network_dict):
     Returns:
         dict: Complete network dictionary
     """
+    # Bind the lookup once; every field below is read through it
+    get = network_dict.get
+    
     # Calculate signal percentage from RSSI and noise if available
-    rssi = network_dict.get('rssi', -100)
-    noise = network_dict.get('noise', -100)
+    rssi = get('rssi', -100)
+    noise = get('noise')
     snr = None
     
-    if rssi != -100 and noise != -100:
+    if rssi != -100 and noise is not None and noise != -100:
         snr = rssi - noise
         signal_percent = min(100, max(0, int((snr + 100) * 0.5)))
     else:
@@ -632,18 +986,18 @@ def _finalize_network(network_dict):
         
     # Set defaults for missing fields
     return {
-        'ssid': network_dict.get('ssid', 'Unknown'),
-        'bssid': network_dict.get('bssid', ''),  # macOS doesn't provide BSSID in system_profiler
+        'ssid': get('ssid', 'Unknown'),
+        'bssid': get('bssid', ''),  # macOS doesn't provide BSSID in system_profiler
         'rssi': rssi,
         'signal': signal_percent,
-        'noise': network_dict.get('noise', None),
+        'noise': noise,
         'snr': snr,
-        'channel': network_dict.get('channel', '--'),
-        'freq': network_dict.get('freq', '--'),
-        'band': network_dict.get('band', 'Unknown'),
-        'mode': network_dict.get('mode', '--'),
-        'rate': network_dict.get('rate', '--'),
-        'security': network_dict.get('security', '--'),
+        'channel': get('channel', '--'),
+        'freq': get('freq', '--'),
+        'band': get('band', 'Unknown'),
+        'mode': get('mode', '--'),
+        'rate': get('rate', '--'),
+        'security': get('security', '--'),
     }
 
 
@@ -656,115 +1010,54 @@ def _get_linux_iwlist_networks():
     """
     networks = []
     try:
-        # Try to find wireless interface
-        result = subprocess.run(
-            ["iwconfig"], 
-            capture_output=True, 
-            text=True, 
-            check=False
-        )
-        
-        # Find wireless interface name
-        interface = None
-        for line in result.stdout.splitlines():
-            if "IEEE 802.11" in line or "ESSID:" in line:
-                interface = line.split()[0]
-                break
-        
-        if not interface:
+        interface = _detect_linux_interface()
+        if not interface or not _have_tool("iwlist"):
             return networks
         
-        # Try iw scan first (newer and more reliable)
-        networks_iw = _get_linux_iw_networks(interface)
-        if networks_iw:
-            return networks_iw
-            
-        # Fallback to iwlist scan
-        scan_cmd = ["iwlist", interface, "scan"]
-        try:
-            scan_result = subprocess.run(scan_cmd, capture_output=True, text=True, check=True)
-        except subprocess.CalledProcessError:
-            # Try with sudo if permission denied
-            scan_cmd = ["sudo"] + scan_cmd
-            scan_result = subprocess.run(scan_cmd, capture_output=True, text=True, check=True)
+        # iw was already tried by get_wifi_networks(); use the older iwlist scan
+        scan_result = _run_with_sudo_fallback(
+            ["iwlist", interface, "scan"],
+            lambda cmd: subprocess.run(cmd, capture_output=True, check=True, **_LINUX_TEXT),
+        )
         
-        # Parse iwlist output
+        # Parse iwlist output in one combined pass; each match is dispatched on
+        # the field (named group) it captured
         current_net = {}
-        for line in scan_result.stdout.splitlines():
-            line = line.strip()
+        for m in _RE_IWLIST.finditer(scan_result.stdout):
+            kind = m.lastgroup
+            value = m.group(kind)
             
-            if line.startswith("Cell "):
+            if kind == "bssid":
                 # New network entry
                 if current_net and current_net.get('ssid'):
                     networks.append(current_net)
-                current_net = {}
+                current_net = {'bssid': value}
                 
-                # Extract BSSID and frequency from Cell line
-                parts = line.split()
-                for i, part in enumerate(parts):
-                    if part == "Address:" and i + 1 < len(parts):
-                        current_net['bssid'] = parts[i + 1]
-                    elif part == "Frequency:" and i + 1 < len(parts):
-                        freq_str = parts[i + 1]
-                        if freq_str.endswith("GHz"):
-                            freq_ghz = float(freq_str[:-3])
-                            current_net['freq'] = str(int(freq_ghz * 1000))  # Convert to MHz
-            
-            elif line.startswith("Channel:"):
-                current_net['channel'] = line.split(":")[1].strip()
+            elif kind == "freq":
+                current_net['freq'] = str(round(float(value) * 1000))  # Convert to MHz
+                
+            elif kind == "ch":
+                current_net['channel'] = value
                 
-            elif line.startswith("Quality=") or "Signal level=" in line:
-                # More comprehensive signal parsing
-                # Examples:
-                # Quality=70/70  Signal level=-40 dBm  Noise level=-89 dBm
-                # Quality=5/5  Signal level=1 dBm
-                # Signal level=-42 dBm
+            elif kind == "sig":
+                current_net['rssi'] = int(float(value))
                 
-                if "Signal level=" in line:
-                    # Extract signal strength
-                    signal_match = re.search(r"Signal level=(-?\d+(?:\.\d+)?)\s*dBm", line)
-                    if signal_match:
-                        try:
-                            current_net['rssi'] = int(float(signal_match.group(1)))
-                        except ValueError:
-                            current_net['rssi'] = -100
-                    else:
-                        # Try alternative format: Signal level=-42 dBm
-                        signal_match = re.search(r"Signal level=(-?\d+)", line)
-                        if signal_match:
-                            try:
-                                current_net['rssi'] = int(signal_match.group(1))
-                            except ValueError:
-                                current_net['rssi'] = -100
-                        
-                if "Noise level=" in line:
-                    # Extract noise floor
-                    noise_match = re.search(r"Noise level=(-?\d+(?:\.\d+)?)\s*dBm", line)
-                    if noise_match:
-                        try:
-                            noise_val = int(float(noise_match.group(1)))
-                            current_net['noise'] = noise_val
-                            
-                            # Calculate SNR if we have both signal and noise
-                            if current_net.get('rssi') and current_net['rssi'] != -100:
-                                current_net['snr'] = current_net['rssi'] - noise_val
-                        except ValueError:
-                            pass
-                        
-            elif line.startswith("ESSID:"):
-                essid = line.split(":", 1)[1].strip().strip('"')
-                if essid and essid != "<hidden>":
-                    current_net['ssid'] = essid
+            elif kind == "noise":
+                noise_val = int(float(value))
+                current_net['noise'] = noise_val
+                # Calculate SNR if we have both signal and noise
+                if current_net.get('rssi') and current_net['rssi'] != -100:
+                    current_net['snr'] = current_net['rssi'] - noise_val
+                    
+            elif kind == "essid":
+                if value and value != "<hidden>":
+                    current_net['ssid'] = value
                     
-            elif line.startswith("Mode:"):
-                mode = line.split(":", 1)[1].strip()
-                current_net['mode'] = "Infra" if mode == "Master" else mode
+            elif kind == "mode":
+                current_net['mode'] = "Infra" if value == "Master" else value
                 
-            elif "Encryption key:" in line:
-                if "off" in line.lower():
-                    current_net['security'] = "None"
-                else:
-                    current_net['security'] = "WPA/WPA2"  # Default assumption
+            else:  # enc
+                current_net['security'] = "None" if value == "off" else "WPA/WPA2"  # Default assumption
         
         # Don't forget the last network
         if current_net and current_net.get('ssid'):
@@ -777,6 +1070,135 @@ def _get_linux_iwlist_networks():
     return networks
 
 
+def _have_tool(name):
+    """
+    Check whether a command is on PATH, so scans skip launching tools that are
+    not installed. A found tool is remembered for the life of the process; a
+    missing one is looked up again next time (it may be installed meanwhile).
+    
+    Args:
+        name (str): Command name, e.g. 'iw'
+        
+    Returns:
+        bool: True if the command was found
+    """
+    if name in _FOUND_TOOLS:
+        return True
+    if shutil.which(name) is None:
+        return False
+    _FOUND_TOOLS.add(name)
+    return True
+
+
+def _detect_linux_interface():
+    """
+    Find the wireless interface name, e.g. 'wlan0'.
+    
+    Asks 'iw dev' first and falls back to the older iwconfig. A found interface
+    is kept for the life of the process, since rescans reuse the same adapter;
+    a failed lookup is retried on the next scan (the adapter may not be up yet).
+    
+    Returns:
+        str or None: Interface name, or None if no wireless interface was found
+    """
+    global _LINUX_INTERFACE
+    if _LINUX_INTERFACE is None:
+        _LINUX_INTERFACE = _find_linux_interface()
+    return _LINUX_INTERFACE
+
+
+def _find_linux_interface():
+    """
+    Look up the wireless interface name for _detect_linux_interface().
+    
+    Returns:
+        str or None: Interface name, or None if no wireless interface was found
+    """
+    if _have_tool("iw"):
+        try:
+            result = subprocess.run(["iw", "dev"], capture_output=True, check=False, **_LINUX_TEXT)
+            for line in result.stdout.splitlines():
+                line = line.strip()
+                if line.startswith("Interface "):
+                    return line.split()[1]
+        except (FileNotFoundError, OSError):
+            pass
+    if _have_tool("iwconfig"):
+        try:
+            result = subprocess.run(["iwconfig"], capture_output=True, check=False, **_LINUX_TEXT)
+            for line in result.stdout.splitlines():
+                if "IEEE 802.11" in line or "ESSID:" in line:
+                    return line.split()[0]
+        except (FileNotFoundError, OSError):
+            pass
+    return None
+
+
+def _get_linux_iw_scan():
+    """
+    Scan with 'iw dev <iface> scan' and build the get_wifi_networks() result.
+    
+    Returns:
+        Tuple[Dict[str, dict], str] or None: Networks keyed by unique_id and the
+        associated unique_id (or None), or None if iw is unavailable or found nothing
+    """
+    interface = _detect_linux_interface()
+    networks = _get_linux_iw_networks(interface) if interface else []
+    if not networks:
+        return None
+    all_networks = {}
+    connected_unique_id = None
+    for net in networks:
+        net['channel'] = freq_to_channel(net.get('freq'))
+        net['band'] = _band_for_freq(net.get('freq'), net['channel'])
+        net.setdefault('mode', "Infra")
+        unique_id = f"{net['ssid']}_{net.get('freq', '--')}"
+        all_networks[unique_id] = _finalize_network(net)
+        if net.get('active'):
+            connected_unique_id = unique_id
+    return all_networks, connected_unique_id
+
+
+def _set_iw_freq(network, value):
+    """Set freq in whole MHz from a value such as '5745.0'."""
+    try:
+        network['freq'] = str(int(float(value)))  # Convert to integer MHz
+    except ValueError:
+        network['freq'] = value
+
+
+def _set_iw_signal(network, value):
+    """Set rssi from a value such as '-42.00 dBm'."""
+    try:
+        network['rssi'] = int(float(value.split(None, 1)[0]))
+    except (ValueError, IndexError):
+        network['rssi'] = -100
+
+
+def _set_iw_ssid(network, value):
+    """Set the SSID, ignoring hidden ('' or '--') names."""
+    if value and value != "--":
+        network['ssid'] = value
+
+
+def _set_iw_security(network, value):
+    """Set a basic security label from the capability flags."""
+    network['security'] = "WPA/WPA2" if "Privacy" in value else "None"  # Default assumption
+
+
+# iw scan field name -> handler(network, value) for _get_linux_iw_networks()
+_IW_FIELD_HANDLERS = {
+    "freq": _set_iw_freq,
+    "signal": _set_iw_signal,
+    "SSID": _set_iw_ssid,
+    "capability": _set_iw_security,
+}
+
+# First characters of the handled iw fields; every other field line is skipped
+# by _parse_iw_lines() before it is split
+_IW_FIRST_CHARS = frozenset(key[0] for key in _IW_FIELD_HANDLERS)
+
+
 def _get_linux_iw_networks(interface):
     """
     Get WiFi networks using iw scan for detailed signal information.
@@ -788,71 +1210,12 @@ def _get_linux_iw_networks(interface):
         List[dict]: List of network dictionaries with signal data
     """
     networks = []
+    if not _have_tool("iw"):
+        return networks
     try:
         # Try iw scan command (more modern than iwlist)
         scan_cmd = ["iw", "dev", interface, "scan"]
-        try:
-            scan_result = subprocess.run(scan_cmd, capture_output=True, text=True, check=True)
-        except subprocess.CalledProcessError:
-            # Try with sudo if permission denied
-            scan_cmd = ["sudo"] + scan_cmd
-            try:
-                scan_result = subprocess.run(scan_cmd, capture_output=True, text=True, check=True)
-            except subprocess.CalledProcessError:
-                return networks  # iw not available or failed
-        
-        # Parse iw scan output
-        current_net = {}
-        for line in scan_result.stdout.splitlines():
-            line = line.strip()
-            
-            if line.startswith("BSS "):
-                # New network entry
-                if current_net and current_net.get('ssid'):
-                    networks.append(current_net)
-                current_net = {}
-                
-                # Extract BSSID and frequency from BSS line
-                # Example: BSS 12:34:56:78:9a:bc(on wlan0) -- associated
-                parts = line.split()
-                if len(parts) > 1:
-                    bssid_part = parts[1]
-                    # Remove any parentheses and extra info
-                    bssid = bssid_part.split('(')[0]
-                    current_net['bssid'] = bssid
-                    
-            elif line.startswith("freq:"):
-                freq_str = line.split(":")[1].strip()
-                try:
-                    current_net['freq'] = str(int(float(freq_str)))  # Convert to integer MHz
-                except ValueError:
-                    current_net['freq'] = freq_str
-                
-            elif line.startswith("signal:"):
-                # Extract signal strength
-                # Example: signal: -42.00 dBm
-                signal_match = re.search(r"signal:\s*(-?\d+(?:\.\d+)?)\s*dBm", line)
-                if signal_match:
-                    try:
-                        current_net['rssi'] = int(float(signal_match.group(1)))
-                    except ValueError:
-                        current_net['rssi'] = -100
-                        
-            elif line.startswith("SSID:"):
-                ssid = line.split(":", 1)[1].strip()
-                if ssid and ssid != "--":
-                    current_net['ssid'] = ssid
-                    
-            elif "capability:" in line.lower():
-                # Extract basic security info from capability
-                if "Privacy" in line:
-                    current_net['security'] = "WPA/WPA2"  # Default assumption
-                else:
-                    current_net['security'] = "None"
-        
-        # Don't forget the last network
-        if current_net and current_net.get('ssid'):
-            networks.append(current_net)
+        networks = _run_with_sudo_fallback(scan_cmd, lambda cmd: _parse_iw_lines(_stream_lines(cmd)))
             
     except (subprocess.CalledProcessError, FileNotFoundError, OSError, ValueError):
         # If iw fails, return empty list
@@ -861,6 +1224,135 @@ def _get_linux_iw_networks(interface):
     return networks
 
 
+def _parse_iw_lines(lines):
+    """
+    Parse 'iw dev <iface> scan' output into network dictionaries.
+    
+    Args:
+        lines (iterable): Output lines, e.g. streamed from the iw process
+        
+    Returns:
+        List[dict]: List of network dictionaries with signal data
+    """
+    networks = []
+    # Per-line helpers bound once as locals
+    append = networks.append
+    handler_for = _IW_FIELD_HANDLERS.get
+    first_chars = _IW_FIRST_CHARS
+    field_count = len(_IW_FIELD_HANDLERS)
+    current_net = {}
+    seen = set()  # handled field names in the current BSS block
+    for line in lines:
+        # iw prints 'BSS ' headers at column 0 and the fields read here indented by
+        # exactly one tab, so lines are tested in place instead of stripped first
+        if line.startswith("BSS "):
+            line = line.rstrip()
+            # New network entry
+            if current_net and current_net.get('ssid'):
+                append(current_net)
+            current_net = {}
+            seen = set()
+            
+            # Extract BSSID and frequency from BSS line
+            # Example: BSS 12:34:56:78:9a:bc(on wlan0) -- associated
+            bssid_part = line[4:].lstrip().partition(" ")[0]
+            if bssid_part:
+                # Remove any parentheses and extra info
+                current_net['bssid'] = bssid_part.partition("(")[0]
+            if line.endswith("-- associated"):
+                current_net['active'] = True
+            continue
+            
+        # Once every field of this BSS is read, the rest of its block is skipped
+        if len(seen) == field_count:
+            continue
+        # Most iw lines are IEs and capabilities nobody reads (nested ones start
+        # with a second tab); one set test on the character after the tab drops them
+        if line[1:2] not in first_chars:
+            continue
+            
+        # Other fields dispatch on the name before the first ':'
+        key, sep, value = line[1:].partition(":")
+        handler = handler_for(key) if sep else None
+        if handler is not None:
+            handler(current_net, value.strip())
+            seen.add(key)
+    
+    # Don't forget the last network
+    if current_net and current_net.get('ssid'):
+        networks.append(current_net)
+    return networks
+
+
+def _trigger_linux_rescan():
+    """
+    Ask NetworkManager to start a fresh WiFi scan. The rescan runs asynchronously;
+    results are read later with 'nmcli device wifi list'. Failures (nmcli missing,
+    rescan rate limited, no permission) are ignored.
+    """
+    if not _have_tool("nmcli"):
+        return
+    try:
+        subprocess.run(list(_NMCLI_RESCAN_ARGV), capture_output=True, check=False)
+    except (FileNotFoundError, OSError):
+        pass
+
+
+def _run_with_sudo_fallback(cmd, run):
+    """
+    Call run(cmd), retrying under sudo (_SUDO_ARGV) if it fails and we are not root.
+    Sudo runs are serialized with _SUDO_LOCK, since callers may run concurrently.
+    A tool that needed sudo is remembered for the life of the process, so later
+    scans skip the plain attempt that would fail again.
+    
+    Args:
+        cmd (list): Command and arguments
+        run (callable): Runs a command and returns the result, raising
+            subprocess.CalledProcessError on failure
+        
+    Returns:
+        The result of run()
+        
+    Raises:
+        subprocess.CalledProcessError: If the command fails with and without sudo
+    """
+    tool = cmd[0]
+    if tool in _NEEDS_SUDO:
+        try:
+            with _SUDO_LOCK:
+                return run(_SUDO_ARGV + cmd)
+        except subprocess.CalledProcessError:
+            _NEEDS_SUDO.discard(tool)  # probe the plain command again next time
+            raise
+    try:
+        return run(cmd)
+    except subprocess.CalledProcessError:
+        if _IS_ROOT:
+            raise  # sudo would not change anything
+        # Try with sudo if permission denied, one sudo command at a time
+        with _SUDO_LOCK:
+            result = run(_SUDO_ARGV + cmd)
+        _NEEDS_SUDO.add(tool)
+        return result
+
+
+def _stream_lines(cmd):
+    """
+    Run a command and yield its stdout lines as the process produces them,
+    instead of buffering the whole output first.
+    
+    Args:
+        cmd (list): Command and arguments
+        
+    Raises:
+        subprocess.CalledProcessError: After the output is consumed, if the command failed
+    """
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, **_LINUX_TEXT) as proc:
+        yield from proc.stdout
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
 def _get_linux_nmcli_networks():
     """
     Get WiFi networks using nmcli for connection and basic info.
@@ -869,56 +1361,56 @@ def _get_linux_nmcli_networks():
         List[dict]: List of network dictionaries from nmcli
     """
     networks = []
+    if not _have_tool("nmcli"):
+        return networks
     try:
-        # Check for root privileges
-        is_root = (os.geteuid() == 0)
-        nmcli_cmd = ["nmcli", "-t", "-f", "ACTIVE,SSID,BSSID,SIGNAL,CHAN,FREQ,MODE,RATE,SECURITY", "device", "wifi", "list"]
-        if not is_root:
-            try:
-                scan_result = subprocess.run(nmcli_cmd, capture_output=True, text=True, check=True)
-            except subprocess.CalledProcessError:
-                # Try with sudo if permission denied
-                nmcli_cmd = ["sudo"] + nmcli_cmd
-                scan_result = subprocess.run(nmcli_cmd, capture_output=True, text=True, check=True)
-        else:
-            scan_result = subprocess.run(nmcli_cmd, capture_output=True, text=True, check=True)
-        
-        for line in scan_result.stdout.splitlines():
-            # nmcli escapes colons in BSSID and other fields as \:
-            # Split only on unescaped colons
-            fields = re.split(r'(?<!\\):', line.strip())
-            # Unescape colons in fields
-            fields = [f.replace('\\:', ':').replace('\\', '') for f in fields]
-            if len(fields) >= 9:
-                active = fields[0].strip()
-                ssid = fields[1].strip()
-                if not ssid:
-                    ssid = "<hidden>"  # empty SSID
-                bssid = fields[2].strip()
-                signal_percent = int(fields[3]) if fields[3].isdigit() else 0
-                channel = fields[4].strip()
-                freq = fields[5].replace(" MHz","").strip()
-                mode = fields[6].strip()
-                rate = fields[7].strip()
-                security = fields[8].strip()
-                band = "2.4GHz" if freq and freq.startswith("2") else "5GHz"
-                
-                networks.append({
-                    "ssid": ssid,
-                    "bssid": bssid,
-                    "rssi": -100,  # Will be overwritten by iwlist if available
-                    "signal": signal_percent,
-                    "channel": channel,
-                    "freq": freq,
-                    "band": band,
-                    "mode": mode,
-                    "rate": rate,
-                    "security": security,
-                    "active": (active == "yes"),
-                })
+        networks = _run_with_sudo_fallback(
+            list(_NMCLI_LIST_ARGV), lambda cmd: _parse_nmcli_lines(_stream_lines(cmd))
+        )
                 
-    except (subprocess.CalledProcessError, FileNotFoundError, OSError, ValueError):
+    except (subprocess.CalledProcessError, FileNotFoundError, OSError, ValueError, csv.Error):
         # If nmcli fails, return empty list
         pass
         
     return networks
+
+
+def _parse_nmcli_lines(lines):
+    """
+    Parse nmcli terse output (ACTIVE,SSID,BSSID,SIGNAL,CHAN,FREQ,MODE,RATE,SECURITY).
+    
+    Args:
+        lines (iterable): Output lines, e.g. streamed from the nmcli process
+        
+    Returns:
+        List[dict]: List of network dictionaries from nmcli
+    """
+    networks = []
+    # Per-line helpers bound once as locals
+    append = networks.append
+    band_for = _band_for_freq
+    # csv tokenizes every line in C, resolving nmcli's \: and \\ escapes (e.g. in BSSIDs)
+    for fields in csv.reader(lines, **_NMCLI_CSV):
+        if len(fields) >= 9:
+            # csv has already unescaped every field; each is normalized in one step
+            active, ssid, bssid, signal, channel, freq, mode, rate, security = fields[:9]
+            ssid = ssid.strip() or "<hidden>"  # empty SSID
+            signal_percent = int(signal) if signal.isdigit() else 0
+            channel = channel.strip()
+            freq = freq.partition(" MHz")[0].strip()
+            band = band_for(freq, channel)
+            
+            append({
+                "ssid": ssid,
+                "bssid": bssid.strip(),
+                "rssi": -100,  # Will be overwritten by iwlist if available
+                "signal": signal_percent,
+                "channel": channel,
+                "freq": freq,
+                "band": band,
+                "mode": mode.strip(),
+                "rate": rate.strip(),
+                "security": security.strip(),
+                "active": (active.strip() == "yes"),
+            })
+    return networks